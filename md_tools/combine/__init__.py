@@ -86,9 +86,10 @@ class CombineTool(MDTool):
         if not file_list.is_file():
             raise FileNotFoundError(f"File list not found: {file_list}")
 
-        lines = file_list.read_text(encoding="utf-8").splitlines()
-        paths = [Path(line.strip()) for line in lines if line.strip()]
-        return paths
+        # Lines are consumed as the file is read instead of splitting the whole text first.
+        with file_list.open(encoding="utf-8") as handle:
+            entries = (line.strip() for line in handle)
+            return [Path(entry) for entry in entries if entry]
 
     def validate_inputs(self, paths: Sequence[Path]) -> None:
         missing = [path for path in paths if not path.is_file()]
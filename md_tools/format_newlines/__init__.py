@@ -3,7 +3,7 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
-from ..paragraphs import collect_paragraphs_with_metadata
+from ..paragraphs import iter_paragraph_metadata
 from ..pipeline.core import PipelineOutputSpec
 from ..tools.base import MDTool
 from ..tools import register_tool
@@ -82,15 +82,12 @@ class FormatNewlinesTool(MDTool):
         if not text:
             return text
 
-        _, metadata = collect_paragraphs_with_metadata(text, newline=newline)
-        if not metadata:
-            return text
-
         result_parts: list[str] = []
         pending_blank_lines = 0
         previous_type: str | None = None
 
-        for entry in metadata:
+        # Entries are consumed as they are parsed; the joined paragraph strings are never needed.
+        for entry in iter_paragraph_metadata(text, newline=newline):
             entry_type = entry["type"]
             entry_text = newline.join(entry["lines"])
             if entry_type == "blank":
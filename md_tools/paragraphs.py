@@ -1,10 +1,25 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .utils import detect_newline
 
 
+# Anything that could start a non-text block: equation delimiters, table pipes, or a
+# line opening with an image, fence, HTML, table border or reference marker.
+# Line starts are matched after any CR or LF so every newline style is covered.
+_STRUCTURE_HINT = re.compile(r"\$\$|\||(?:\A|[\r\n])\s*[!`~<+\[]")
+_STRUCTURE_STARTS = frozenset("!`~<+[")
+_FENCE_PREFIXES = ("```", "~~~")
+
+
+def _is_plain_text(stripped: str) -> bool:
+    """True when a non-blank stripped line cannot open any structured block."""
+
+    return stripped[0] not in _STRUCTURE_STARTS and "$$" not in stripped and "|" not in stripped
+
+
 def count_equation_delimiters(stripped: str) -> int:
     return stripped.count("$$")
 
@@ -58,6 +73,22 @@ def is_html_block_end(stripped: str) -> bool:
     return False
 
 
+def _entry(kind: str, content_lines: List[str], start_idx: int, end_idx: int) -> Dict[str, Any]:
+    return {
+        "type": kind,
+        "lines": content_lines,
+        "line_start": start_idx,
+        "line_end": end_idx,
+    }
+
+
+def _line_entries(lines: List[str]) -> Iterator[Dict[str, Any]]:
+    return (
+        _entry("text" if line.strip() else "blank", [line], index, index)
+        for index, line in enumerate(lines)
+    )
+
+
 class MarkdownParagraphExtractor:
     """Parse Markdown text into paragraphs with structural metadata."""
 
@@ -66,27 +97,29 @@ class MarkdownParagraphExtractor:
 
     def collect(self, text: str) -> Tuple[List[str], List[Dict[str, Any]]]:
         lines = text.split(self.newline)
-        paragraphs: List[str] = []
-        metadata: List[Dict[str, Any]] = []
+        if not _STRUCTURE_HINT.search(text):
+            # Only text and blank lines, and each of those is a paragraph of its own.
+            return lines, list(_line_entries(lines))
+        metadata = list(self._iter_structured(lines))
+        return [self.newline.join(entry["lines"]) for entry in metadata], metadata
+
+    def iter_entries(self, text: str) -> Iterator[Dict[str, Any]]:
+        """Iterate metadata entries as they are parsed, without joining paragraph strings."""
+
+        lines = text.split(self.newline)
+        if not _STRUCTURE_HINT.search(text):
+            return _line_entries(lines)
+        return self._iter_structured(lines)
+
+    def _iter_structured(self, lines: List[str]) -> Iterator[Dict[str, Any]]:
         buffer: List[str] = []
         state: Optional[str] = None
         state_start: Optional[int] = None
         equation_parity = 0
-        fence_marker: Optional[str] = None
+        line_count = len(lines)
         i = 0
 
-        def add_paragraph(kind: str, content_lines: List[str], start_idx: int, end_idx: int) -> None:
-            paragraphs.append(self.newline.join(content_lines))
-            metadata.append(
-                {
-                    "type": kind,
-                    "lines": content_lines[:],
-                    "line_start": start_idx,
-                    "line_end": end_idx,
-                }
-            )
-
-        while i < len(lines):
+        while i < line_count:
             line = lines[i]
             stripped = line.strip()
 
@@ -94,7 +127,7 @@ class MarkdownParagraphExtractor:
                 buffer.append(line)
                 equation_parity = (equation_parity + count_equation_delimiters(stripped)) % 2
                 if equation_parity == 0:
-                    add_paragraph(
+                    yield _entry(
                         "equation",
                         buffer,
                         state_start if state_start is not None else i - len(buffer) + 1,
@@ -109,7 +142,7 @@ class MarkdownParagraphExtractor:
             if state == "html":
                 buffer.append(line)
                 if is_html_block_end(stripped):
-                    add_paragraph(
+                    yield _entry(
                         "html",
                         buffer,
                         state_start if state_start is not None else i - len(buffer) + 1,
@@ -126,7 +159,7 @@ class MarkdownParagraphExtractor:
                     buffer.append(line)
                     i += 1
                     continue
-                add_paragraph(
+                yield _entry(
                     "table",
                     buffer,
                     state_start if state_start is not None else i - len(buffer),
@@ -142,7 +175,7 @@ class MarkdownParagraphExtractor:
                     buffer.append(line)
                     i += 1
                     continue
-                add_paragraph(
+                yield _entry(
                     "image_block",
                     buffer,
                     state_start if state_start is not None else i - len(buffer),
@@ -153,24 +186,13 @@ class MarkdownParagraphExtractor:
                 state_start = None
                 continue
 
-            if state == "fence":
-                buffer.append(line)
-                if fence_marker and stripped.startswith(fence_marker):
-                    add_paragraph(
-                        "code_fence",
-                        buffer,
-                        state_start if state_start is not None else i - len(buffer) + 1,
-                        i,
-                    )
-                    buffer = []
-                    state = None
-                    state_start = None
-                    fence_marker = None
+            if not stripped:
+                yield _entry("blank", [line], i, i)
                 i += 1
                 continue
 
-            if not stripped:
-                add_paragraph("blank", [line], i, i)
+            if _is_plain_text(stripped):
+                yield _entry("text", [line], i, i)
                 i += 1
                 continue
 
@@ -181,18 +203,24 @@ class MarkdownParagraphExtractor:
                 i += 1
                 continue
 
-            if stripped.startswith("```") or stripped.startswith("~~~"):
-                buffer = [line]
-                state = "fence"
-                state_start = i
+            if stripped.startswith(_FENCE_PREFIXES):
+                # Nothing inside a fence is classified, so scan straight to the closing marker.
                 fence_marker = stripped[:3]
-                i += 1
+                end = i + 1
+                while end < line_count and not lines[end].lstrip().startswith(fence_marker):
+                    end += 1
+                if end < line_count:
+                    yield _entry("code_fence", lines[i : end + 1], i, end)
+                else:
+                    # Unterminated fences run to the end of the document.
+                    yield _entry("fence", lines[i:], i, line_count - 1)
+                i = end + 1
                 continue
 
             delimiter_count = count_equation_delimiters(stripped)
             if delimiter_count:
                 if is_equation_single_line(stripped):
-                    add_paragraph("equation_single", [line], i, i)
+                    yield _entry("equation_single", [line], i, i)
                     i += 1
                     continue
 
@@ -201,7 +229,7 @@ class MarkdownParagraphExtractor:
                 state_start = i
                 equation_parity = delimiter_count % 2
                 if equation_parity == 0:
-                    add_paragraph("equation_single", buffer, state_start, i)
+                    yield _entry("equation_single", buffer, state_start, i)
                     buffer = []
                     state = None
                     state_start = None
@@ -210,15 +238,15 @@ class MarkdownParagraphExtractor:
 
             if is_html_block_start(stripped):
                 if "</" in stripped and stripped.count("<") == stripped.count("</") + 1:
-                    add_paragraph("html_single", [line], i, i)
+                    yield _entry("html_single", [line], i, i)
                 elif "</" in stripped and stripped.count("</") >= 1 and stripped.count("<") > 1:
-                    add_paragraph("html_single", [line], i, i)
+                    yield _entry("html_single", [line], i, i)
                 else:
                     buffer = [line]
                     state = "html"
                     state_start = i
                     if is_html_block_end(stripped):
-                        add_paragraph("html_single", buffer, state_start, i)
+                        yield _entry("html_single", buffer, state_start, i)
                         buffer = []
                         state = None
                         state_start = None
@@ -233,23 +261,21 @@ class MarkdownParagraphExtractor:
                 continue
 
             if is_reference_definition(stripped):
-                add_paragraph("reference", [line], i, i)
+                yield _entry("reference", [line], i, i)
                 i += 1
                 continue
 
-            add_paragraph("text", [line], i, i)
+            yield _entry("text", [line], i, i)
             i += 1
 
         if state and buffer:
-            add_paragraph(
+            yield _entry(
                 state,
                 buffer,
-                state_start if state_start is not None else len(lines) - len(buffer),
-                len(lines) - 1,
+                state_start if state_start is not None else line_count - len(buffer),
+                line_count - 1,
             )
 
-        return paragraphs, metadata
-
 
 def collect_paragraphs_with_metadata(
     text: str,
@@ -261,6 +287,16 @@ def collect_paragraphs_with_metadata(
     return extractor.collect(text)
 
 
+def iter_paragraph_metadata(text: str, *, newline: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Stream the entries of ``collect_paragraphs_with_metadata`` for callers that only need metadata."""
+
+    newline_value = newline or detect_newline(text)
+    return MarkdownParagraphExtractor(newline_value).iter_entries(text)
+
+
 def collect_paragraphs(text: str, *, newline: Optional[str] = None) -> List[str]:
+    if not _STRUCTURE_HINT.search(text):
+        # Plain text: every line is a paragraph, so skip building metadata.
+        return text.split(newline or detect_newline(text))
     paragraphs, _ = collect_paragraphs_with_metadata(text, newline=newline)
     return paragraphs
@@ -83,7 +83,7 @@ def _split_stages(tokens: Sequence[str]) -> List[List[str]]:
 
 
 def _parse_stage(
-    parser_factory: Callable[[], argparse.ArgumentParser],
+    parser: argparse.ArgumentParser,
     tokens: Sequence[str],
 ) -> argparse.Namespace:
     if tokens and tokens[0] == "split":
@@ -95,7 +95,6 @@ def _parse_stage(
             else:
                 tokens = [tokens[0], "--parts", tokens[1], *tokens[2:]]
 
-    parser = parser_factory()
     try:
         args = parser.parse_args(tokens)
     except SystemExit as exc:
@@ -123,9 +122,12 @@ def build_pipeline_definition(
     input_path: Path,
 ) -> PipelineDefinition:
     stages_raw = _split_stages(raw_tokens)
+    # Building the full CLI parser costs far more than parsing with it, and parsing
+    # leaves it untouched, so every stage of one definition shares a single parser.
+    parser = parser_factory()
     parsed: List[PipelineStage] = []
     for tokens in stages_raw:
-        args = _parse_stage(parser_factory, tokens)
+        args = _parse_stage(parser, tokens)
         stage_name = getattr(args, "command", tokens[0] if tokens else "<unknown>")
         pipeline_func = getattr(args, "pipeline_func", None)
         if pipeline_func is None:
@@ -6,7 +6,7 @@ from typing import List, Optional, Tuple
 from ...paragraphs import collect_paragraphs
 from ...pipeline.types import MarkdownArtifact, MarkdownDocument, PipelineStageError
 from ...pipeline.stage_runner import PipelineStageRunner
-from ...utils import detect_newline, normalise_paragraph_newlines
+from ...utils import detect_newline
 
 
 def _load_document(args, stage_name: str) -> Tuple[MarkdownDocument, Optional[Path]]:
@@ -37,7 +37,9 @@ def _build_part_name(base_name: Optional[str], index: int) -> str:
 
 
 def _split_document(tool, document: MarkdownDocument, parts: int, stage_name: str) -> Tuple[List[MarkdownDocument], List[List[str]], str, int]:
-    paragraphs = collect_paragraphs(document.text)
+    newline = detect_newline(document.text)
+    # Paragraphs come back joined with the document's own newline, ready to write.
+    paragraphs = collect_paragraphs(document.text, newline=newline)
     paragraph_count = len(paragraphs)
 
     if paragraph_count == 0:
@@ -52,14 +54,12 @@ def _split_document(tool, document: MarkdownDocument, parts: int, stage_name: st
             stage=stage_name,
         )
 
-    newline = detect_newline(document.text)
     grouped = tool.split_paragraphs(paragraphs, parts)
 
     documents: List[MarkdownDocument] = []
     separator = newline * 2
     for idx, chunk in enumerate(grouped, start=1):
-        normalised = normalise_paragraph_newlines(chunk, newline)
-        content = separator.join(normalised)
+        content = separator.join(chunk)
         if content and not content.endswith(newline):
             content += newline
         part_name = _build_part_name(document.name, idx)
@@ -8,7 +8,7 @@ from ..paragraphs import collect_paragraphs
 from ..pipeline.core import PipelineOutputSpec
 from ..tools.base import MDTool
 from ..tools import register_tool
-from ..utils import detect_newline, normalise_paragraph_newlines
+from ..utils import detect_newline
 
 
 class SplitTool(MDTool):
@@ -69,7 +69,9 @@ class SplitTool(MDTool):
             return 1
 
         text = args.input.read_text(encoding="utf-8")
-        paragraphs = collect_paragraphs(text)
+        newline = detect_newline(text)
+        # Paragraphs come back joined with the document's own newline, ready to write.
+        paragraphs = collect_paragraphs(text, newline=newline)
 
         paragraph_count = len(paragraphs)
         if paragraph_count == 0:
@@ -82,7 +84,6 @@ class SplitTool(MDTool):
             )
             return 1
 
-        newline = detect_newline(text)
         grouped = self.split_paragraphs(paragraphs, parts)
         written_paths = self.write_parts(
             grouped,
@@ -187,8 +188,7 @@ class SplitTool(MDTool):
         written_paths: List[Path] = []
 
         for idx, paragraphs in enumerate(parts, start=1):
-            normalised = normalise_paragraph_newlines(paragraphs, newline)
-            content = separator.join(normalised)
+            content = separator.join(paragraphs)
             if content and not content.endswith(newline):
                 content += newline
 
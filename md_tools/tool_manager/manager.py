@@ -71,12 +71,17 @@ class ToolManager:
     def run_payloads(self, payloads: Sequence[PipelinePayloadLike]) -> list[MarkdownArtifact]:
         normalized = [self._ensure_payload(payload) for payload in payloads]
         definitions = [self.build_definition_from_payload(payload) for payload in normalized]
-        artifacts: list[MarkdownArtifact] = []
-        for definition in definitions:
-            if not definition.input_path.is_file():
-                raise FileNotFoundError(f"Pipeline input file not found: {definition.input_path}")
-            artifacts.append(self._executor(definition))
-        return artifacts
+        return [self._execute(definition) for definition in definitions]
+
+    def run_payload(self, payload: PipelinePayloadLike) -> MarkdownArtifact:
+        """Run a single payload; safe to call from several threads at once."""
+
+        return self._execute(self.build_definition_from_payload(payload))
+
+    def _execute(self, definition: PipelineDefinition) -> MarkdownArtifact:
+        if not definition.input_path.is_file():
+            raise FileNotFoundError(f"Pipeline input file not found: {definition.input_path}")
+        return self._executor(definition)
 
     def build_definition_from_payload(self, payload: PipelinePayloadLike) -> PipelineDefinition:
         actual_payload = self._ensure_payload(payload)
@@ -5,9 +5,6 @@ import sys
 from dataclasses import dataclass
 import os
 from typing import Iterable
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
 
 GOOGLE_TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
@@ -50,6 +47,13 @@ def translate_text(
     fake_mode = os.environ.get(FAKE_TRANSLATE_ENV)
     if fake_mode:
         return _simulate_translation(request, fake_mode)
+
+    # urllib.request pulls in http.client, ssl and email; only pay for it when a
+    # request is actually sent, not on every CLI start-up.
+    from urllib.error import HTTPError, URLError  # noqa: WPS433
+    from urllib.parse import urlencode  # noqa: WPS433
+    from urllib.request import Request, urlopen  # noqa: WPS433
+
     query = urlencode(
         {
             "client": "gtx",
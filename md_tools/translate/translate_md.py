@@ -22,7 +22,7 @@ from ..paragraphs import (
 from ..pipeline.core import PipelineOutputSpec
 from ..tools.base import MDTool
 from ..tools import register_tool
-from ..utils import detect_newline, normalise_paragraph_newlines
+from ..utils import detect_newline
 from .cancellation import TranslationCancelToken, TranslationCancelled
 from .text import TranslationError, translate_text
 
@@ -700,8 +700,10 @@ def translate_markdown_document(
         translated,
     )
 
-    normalised = normalise_paragraph_newlines(bilingual_paragraphs, newline)
-    result = newline.join(normalised)
+    # Joining on LF first converts separators and inner newlines in one pass.
+    result = "\n".join(bilingual_paragraphs)
+    if newline != "\n":
+        result = result.replace("\n", newline)
     if text.endswith(newline):
         result += newline
 
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import io
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional, TextIO
+
+
+class _ThreadRoutedStream(io.TextIOBase):
+    """Stand-in for sys.stdout/sys.stderr that routes writes per thread.
+
+    Threads that registered a target via ``capture_thread_output`` write to it;
+    every other thread (including Textual's own) falls through to the stream
+    that was installed before the router.
+    """
+
+    def __init__(self, fallback: TextIO) -> None:
+        super().__init__()
+        self.fallback = fallback
+        self._local = threading.local()
+
+    def swap_target(self, target: Optional[TextIO]) -> Optional[TextIO]:
+        previous = getattr(self._local, "target", None)
+        self._local.target = target
+        return previous
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: str) -> int:
+        target = getattr(self._local, "target", None)
+        if target is None:
+            return self.fallback.write(data)
+        return target.write(data)
+
+    def flush(self) -> None:
+        target = getattr(self._local, "target", None)
+        if target is None:
+            self.fallback.flush()
+        else:
+            target.flush()
+
+
+_router_lock = threading.Lock()
+_router_users = 0
+_stdout_router: Optional[_ThreadRoutedStream] = None
+_stderr_router: Optional[_ThreadRoutedStream] = None
+
+
+def _acquire_routers() -> tuple[_ThreadRoutedStream, _ThreadRoutedStream]:
+    global _router_users, _stdout_router, _stderr_router
+    with _router_lock:
+        if _router_users == 0 or _stdout_router is None or _stderr_router is None:
+            _stdout_router = _ThreadRoutedStream(sys.stdout)
+            _stderr_router = _ThreadRoutedStream(sys.stderr)
+            sys.stdout = _stdout_router  # type: ignore[assignment]
+            sys.stderr = _stderr_router  # type: ignore[assignment]
+        _router_users += 1
+        return _stdout_router, _stderr_router
+
+
+def _release_routers() -> None:
+    global _router_users, _stdout_router, _stderr_router
+    with _router_lock:
+        _router_users -= 1
+        if _router_users > 0:
+            return
+        # Only restore the originals when nobody replaced the routers meanwhile.
+        if sys.stdout is _stdout_router and _stdout_router is not None:
+            sys.stdout = _stdout_router.fallback
+        if sys.stderr is _stderr_router and _stderr_router is not None:
+            sys.stderr = _stderr_router.fallback
+        _stdout_router = None
+        _stderr_router = None
+
+
+@contextmanager
+def capture_thread_output(target: TextIO) -> Iterator[None]:
+    """Send stdout/stderr written by the current thread to ``target``.
+
+    Unlike ``contextlib.redirect_stdout`` this leaves output from other threads
+    untouched, so concurrent pipeline runs cannot interleave into each other.
+    """
+
+    stdout_router, stderr_router = _acquire_routers()
+    previous_stdout = stdout_router.swap_target(target)
+    previous_stderr = stderr_router.swap_target(target)
+    try:
+        yield
+    finally:
+        stdout_router.swap_target(previous_stdout)
+        stderr_router.swap_target(previous_stderr)
+        _release_routers()
+
+
+__all__ = ["capture_thread_output"]
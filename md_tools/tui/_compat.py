@@ -11,15 +11,34 @@ except ImportError:  # pragma: no cover - compatibility shim
 
         def __init__(self, *_, id: str | None = None, classes: str | None = None, **__) -> None:
             super().__init__(id=id, classes=classes)
+            self._last_line: Static | None = None
 
         def write(self, line: str) -> None:
             if not line:
                 line = ""
-            self.mount(Static(line, classes="log-line"))
+            self._last_line = Static(line, classes="log-line", markup=False)
+            self.mount(self._last_line)
+
+        def write_lines(self, lines: list[str]) -> None:
+            """Mount a batch of lines as a single widget."""
+
+            if not lines:
+                return
+            self._last_line = None
+            # Log text is literal: skip markup parsing so "[stage 1]" survives.
+            self.mount(Static("\n".join(lines), classes="log-line", markup=False))
+
+        def replace_last_line(self, line: str) -> bool:
+            """Overwrite the line added by the latest ``write``; False if there is none."""
+
+            if self._last_line is None:
+                return False
+            self._last_line.update(line)
+            return True
 
         def clear(self) -> None:
-            for child in list(self.children):
-                child.remove()
+            self._last_line = None
+            self.remove_children()
 else:  # pragma: no cover - direct re-export
     class TextLog(_TextLog):
         pass
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from textual.widgets import ListItem, Static
+
+
+class LoadMoreItem(ListItem):
+    """Trailing list entry that asks the owning screen to render the next page."""
+
+    def __init__(self, next_count: int, remaining: int) -> None:
+        self._label = Static(self._text(next_count, remaining), markup=False)
+        super().__init__(self._label, classes="load-more")
+
+    def set_counts(self, next_count: int, remaining: int) -> None:
+        self._label.update(self._text(next_count, remaining))
+
+    @staticmethod
+    def _text(next_count: int, remaining: int) -> str:
+        return f"Load {next_count} more... ({remaining} not shown)"
+
+
+__all__ = ["LoadMoreItem"]
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
 from textual.app import App
 from textual.binding import Binding
 
 from ..tool_manager import PipelinePayload, StagePayload, ToolManager
 from ..tools import iter_tool_specs
-from .constants import OUTPUT_FLAG_MAP
-from .step_four import StepFourScreen
+from .constants import (
+    EMPTY_INDICES,
+    EMPTY_OVERRIDES,
+    OUTPUT_FLAG_KEYS,
+    OUTPUT_FLAG_MAP,
+    PIPELINE_MAX_WORKERS,
+    SCAN_BATCH_SIZE,
+)
+from .step_four import ProgressReporter, StepFourScreen, WorkerRunner
 from .step_one import StepOneScreen
 
 APP_CSS = """
@@ -114,16 +127,80 @@ Screen {
 """
 
 
-def discover_markdown_files(root: Path) -> list[Path]:
+# Directories that never hold workspace documents; pruned before descending.
+_SKIP_DIRS = frozenset({"node_modules", "__pycache__", ".git", ".venv", "venv", "target", "build", "dist"})
+
+# root -> (mtime_ns of every visited directory, sorted Markdown files)
+_SCAN_CACHE: dict[Path, tuple[dict[str, int], list[Path]]] = {}
+
+
+def _iter_markdown_tree(directory: str, dir_mtimes: dict[str, int]) -> Iterator[str]:
+    """Yield Markdown files depth-first in the same order as sorting their Paths."""
+
+    try:
+        dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+        with os.scandir(directory) as scanner:
+            entries = sorted(scanner, key=lambda entry: os.path.normcase(entry.name))
+    except OSError:
+        return
+    for entry in entries:
+        name = entry.name
+        if entry.is_dir(follow_symlinks=False):
+            if name not in _SKIP_DIRS and not name.startswith("."):
+                yield from _iter_markdown_tree(entry.path, dir_mtimes)
+        elif name.endswith(".md") and entry.is_file():
+            yield entry.path
+
+
+def _scan_is_current(dir_mtimes: dict[str, int]) -> bool:
+    # A directory's mtime changes whenever an entry is added, removed or renamed in it.
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in dir_mtimes.items())
+    except OSError:
+        return False
+
+
+def iter_markdown_batches(
+    root: Path,
+    batch_size: int = SCAN_BATCH_SIZE,
+    cancelled: threading.Event | None = None,
+) -> Iterator[list[Path]]:
+    """Yield the sorted Markdown files under ``root`` in batches as they are found."""
+
     if not root.exists():
-        return []
-    return sorted(path for path in root.rglob("*.md") if path.is_file())
+        return
+    cached = _SCAN_CACHE.get(root)
+    if cached is not None and _scan_is_current(cached[0]):
+        files = cached[1]
+        for start in range(0, len(files), batch_size):
+            yield files[start : start + batch_size]
+        return
+    dir_mtimes: dict[str, int] = {}
+    results: list[Path] = []
+    batch: list[Path] = []
+    for path in _iter_markdown_tree(os.fspath(root), dir_mtimes):
+        if cancelled is not None and cancelled.is_set():
+            return
+        batch.append(Path(path))
+        if len(batch) >= batch_size:
+            results.extend(batch)
+            yield batch
+            batch = []
+    if batch:
+        results.extend(batch)
+        yield batch
+    _SCAN_CACHE[root] = (dir_mtimes, results)
 
 
-@dataclass
+def discover_markdown_files(root: Path) -> list[Path]:
+    return [path for batch in iter_markdown_batches(root) for path in batch]
+
+
+@dataclass(frozen=True)
 class PipelineStageModel:
+    # Immutable so that stage rows and compiled payloads can share it safely.
     name: str
-    args: list[str]
+    args: tuple[str, ...]
 
 
 class ToolManagerApp(App):
@@ -138,18 +215,130 @@ class ToolManagerApp(App):
     def __init__(self, root: Path) -> None:
         super().__init__()
         self.root = Path(root).resolve()
-        self.available_files: list[Path] = discover_markdown_files(self.root)
+        # Filled in batches by a background scan started in on_mount.
+        self.available_files: list[Path] = []
+        self.relative_labels: dict[Path, str] = {}
+        self.scan_complete = False
+        self._scan_task: asyncio.Task | None = None
+        self._scan_cancelled = threading.Event()
+        self._step_one: StepOneScreen | None = None
+        # file -> (parent, stem, suffix) used to derive default output paths.
+        self._output_path_parts: dict[Path, tuple[Path, str, str]] = {}
+        # (file, stage index) -> default output path, valid for _default_path_version.
+        self._default_path_cache: dict[tuple[Path, int], str] = {}
+        self._default_path_version = -1
         self.selected_files: list[Path] = []
-        self.pipeline: list[PipelineStageModel] = []
+        self._pipeline: list[PipelineStageModel] = []
+        # (shared payload, output flag, index of that flag in the args) per stage.
+        self._compiled_stages: list[tuple[StagePayload, str | None, int | None]] | None = None
         self.output_overrides: dict[Path, dict[int, str]] = {}
         self.output_manual_overrides: dict[Path, set[int]] = {}
         self.output_disabled: dict[Path, set[int]] = {}
         self.output_toggle_manual: dict[Path, set[int]] = {}
+        # Bumped on every pipeline change; defaults are in sync when the versions match.
+        self._pipeline_version = 0
+        self._defaults_version: int | None = None
+        # "input -> stage -> ..." text, valid for _graph_version.
+        self._graph_text = "input"
+        self._graph_version = 0
         self.tool_manager = ToolManager()
-        self.tool_names = sorted(spec.tool.name for spec in iter_tool_specs())
+        self._pipeline_executor: ThreadPoolExecutor | None = None
+        # Jobs submitted to the executor that have not finished yet.
+        self._pipeline_jobs: set[Future] = set()
 
     async def on_mount(self) -> None:
-        await self.push_screen(StepOneScreen())
+        self._step_one = StepOneScreen()
+        await self.push_screen(self._step_one)
+        self._scan_task = asyncio.create_task(self._scan_root())
+
+    async def _scan_root(self) -> None:
+        loop = asyncio.get_running_loop()
+        batches: asyncio.Queue[list[Path] | None] = asyncio.Queue()
+
+        def publish(batch: list[Path] | None) -> None:
+            try:
+                loop.call_soon_threadsafe(batches.put_nowait, batch)
+            except RuntimeError:  # pragma: no cover - loop closed during shutdown
+                self._scan_cancelled.set()
+
+        def walk() -> None:
+            try:
+                for batch in iter_markdown_batches(self.root, cancelled=self._scan_cancelled):
+                    publish(batch)
+            finally:
+                publish(None)
+
+        scan = loop.run_in_executor(None, walk)
+        while (batch := await batches.get()) is not None:
+            self._add_discovered_files(batch)
+        await scan
+        self.scan_complete = True
+        if self._step_one is not None:
+            self._step_one.post_message(StepOneScreen.FilesDiscovered([], done=True))
+
+    def _add_discovered_files(self, batch: list[Path]) -> None:
+        self.available_files.extend(batch)
+        root = self.root
+        self.relative_labels.update((path, str(path.relative_to(root))) for path in batch)
+        if self._step_one is not None:
+            self._step_one.post_message(StepOneScreen.FilesDiscovered(batch, done=False))
+
+    def on_unmount(self) -> None:
+        self._scan_cancelled.set()
+        if self._scan_task is not None:
+            self._scan_task.cancel()
+        if self._pipeline_executor is not None:
+            # Queued jobs are cancelled by hand: shutdown(cancel_futures=True) needs Python 3.9.
+            for job in list(self._pipeline_jobs):
+                job.cancel()
+            self._pipeline_executor.shutdown(wait=False)
+            self._pipeline_executor = None
+
+    @cached_property
+    def tool_names(self) -> list[str]:
+        """Registered tool names, resolved when the pipeline builder first needs them."""
+
+        names = [spec.tool.name for spec in iter_tool_specs()]
+        names.sort()
+        return names
+
+    @property
+    def pipeline_executor(self) -> ThreadPoolExecutor:
+        """Worker threads dedicated to pipeline runs, created on first use."""
+
+        if self._pipeline_executor is None:
+            self._pipeline_executor = ThreadPoolExecutor(
+                max_workers=PIPELINE_MAX_WORKERS,
+                thread_name_prefix="md-tool-pipeline",
+            )
+        return self._pipeline_executor
+
+    def submit_pipeline_job(self, func: Callable[[], Any]) -> Future:
+        """Run ``func`` on the pipeline executor and track it until it finishes."""
+
+        job = self.pipeline_executor.submit(func)
+        self._pipeline_jobs.add(job)
+        job.add_done_callback(self._pipeline_jobs.discard)
+        return job
+
+    @property
+    def pipeline(self) -> list[PipelineStageModel]:
+        return self._pipeline
+
+    @pipeline.setter
+    def pipeline(self, stages: list[PipelineStageModel]) -> None:
+        self._pipeline = stages
+        self._compiled_stages = None
+        self._pipeline_version += 1
+
+    @property
+    def pipeline_graph(self) -> str:
+        """Stage chain as shown in Step 2, e.g. ``input -> split -> combine``."""
+
+        if self._graph_version != self._pipeline_version:
+            self._graph_text = " -> ".join(["input", *(stage.name for stage in self.pipeline)])
+            self._graph_version = self._pipeline_version
+        return self._graph_text
 
     # ---- State management helpers ------------------------------------------------
     def set_selected_files(self, files: list[Path]) -> None:
@@ -158,74 +347,166 @@ class ToolManagerApp(App):
         self.output_manual_overrides = {}
         self.output_disabled = {}
         self.output_toggle_manual = {}
-
-    def add_stage(self, name: str, args: list[str]) -> None:
-        self.pipeline.append(PipelineStageModel(name=name, args=args))
-        self.ensure_output_defaults()
+        self._defaults_version = None
+
+    def add_stage(self, name: str, args: Sequence[str]) -> None:
+        in_sync = self._defaults_in_sync()
+        graph_in_sync = self._graph_version == self._pipeline_version
+        self.pipeline.append(PipelineStageModel(name=name, args=tuple(args)))
+        self._pipeline_changed()
+        if graph_in_sync:
+            # Appending a stage only extends the chain.
+            self._graph_text += f" -> {name}"
+            self._graph_version = self._pipeline_version
+        if not in_sync:
+            self.ensure_output_defaults()
+            return
+        # Only the new stage and the previous final stage change their defaults.
+        new_index = len(self.pipeline) - 1
+        self._refresh_stage_defaults(range(max(new_index - 1, 0), new_index + 1))
 
     def remove_stage(self, index: int) -> None:
-        if 0 <= index < len(self.pipeline):
-            del self.pipeline[index]
+        if not 0 <= index < len(self.pipeline):
+            return
+        in_sync = self._defaults_in_sync()
+        del self.pipeline[index]
+        self._pipeline_changed()
+        self._shift_stage_state(index)
+        if not in_sync or not self.pipeline:
             self.ensure_output_defaults()
+            return
+        # Later stages moved down one slot, which changes their default file names.
+        self._refresh_stage_defaults(range(min(index, len(self.pipeline) - 1), len(self.pipeline)))
+
+    def _pipeline_changed(self) -> None:
+        self._compiled_stages = None
+        self._pipeline_version += 1
+
+    def _defaults_in_sync(self) -> bool:
+        return self._defaults_version == self._pipeline_version
 
     def ensure_output_defaults(self) -> None:
-        if not self.pipeline or not self.selected_files:
+        pipeline = self.pipeline
+        selected_files = self.selected_files
+        if not pipeline or not selected_files:
+            return
+        if self._defaults_in_sync():
             return
-        valid_indices = set(self.configurable_stage_indices())
+        valid_indices = tuple(self.configurable_stage_indices())
         if not valid_indices:
             return
+        valid_lookup = frozenset(valid_indices)
+        selected = set(selected_files)
         self.output_overrides = {
-            path: {idx: value for idx, value in mapping.items() if idx in valid_indices}
+            path: {idx: value for idx, value in mapping.items() if idx in valid_lookup}
             for path, mapping in self.output_overrides.items()
-            if path in self.selected_files
+            if path in selected
         }
         self.output_manual_overrides = {
-            path: {idx for idx in indices if idx in valid_indices}
+            path: {idx for idx in indices if idx in valid_lookup}
             for path, indices in self.output_manual_overrides.items()
-            if path in self.selected_files
+            if path in selected
         }
         self.output_disabled = {
-            path: {idx for idx in indices if idx in valid_indices}
+            path: {idx for idx in indices if idx in valid_lookup}
             for path, indices in self.output_disabled.items()
-            if path in self.selected_files
+            if path in selected
         }
         self.output_toggle_manual = {
-            path: {idx for idx in indices if idx in valid_indices}
+            path: {idx for idx in indices if idx in valid_lookup}
             for path, indices in self.output_toggle_manual.items()
-            if path in self.selected_files
+            if path in selected
         }
+        self._refresh_stage_defaults(valid_indices)
+
+    def _refresh_stage_defaults(self, indices: Iterable[int]) -> None:
+        """Recompute default outputs of the given stages for every selected file."""
+
+        pipeline = self.pipeline
+        final_index = len(pipeline) - 1
+        flag_keys = OUTPUT_FLAG_KEYS
+        stage_indices = tuple(indices)
+        configurable = frozenset(idx for idx in stage_indices if idx == final_index or pipeline[idx].name in flag_keys)
+        default_output_path = self._default_output_path
+        output_overrides = self.output_overrides
+        output_manual_overrides = self.output_manual_overrides
+        output_disabled = self.output_disabled
+        output_toggle_manual = self.output_toggle_manual
         for file_path in self.selected_files:
-            mapping = self.output_overrides.setdefault(file_path, {})
-            manual = self.output_manual_overrides.setdefault(file_path, set())
-            disabled = self.output_disabled.setdefault(file_path, set())
-            toggle_manual = self.output_toggle_manual.setdefault(file_path, set())
-            for idx in valid_indices:
-                default_value = self._default_output_path(file_path, idx)
+            mapping = output_overrides.setdefault(file_path, {})
+            manual = output_manual_overrides.setdefault(file_path, set())
+            disabled = output_disabled.setdefault(file_path, set())
+            toggle_manual = output_toggle_manual.setdefault(file_path, set())
+            for idx in stage_indices:
+                if idx not in configurable:
+                    mapping.pop(idx, None)
+                    manual.discard(idx)
+                    disabled.discard(idx)
+                    toggle_manual.discard(idx)
+                    continue
+                default_value = default_output_path(file_path, idx)
                 if idx in manual:
                     mapping.setdefault(idx, default_value)
                 else:
                     mapping[idx] = default_value
-                is_final_stage = idx == len(self.pipeline) - 1
-                allow_disable = not is_final_stage and self.pipeline[idx].name in OUTPUT_FLAG_MAP
-                if is_final_stage:
+                # The final output is mandatory; intermediate outputs start disabled.
+                if idx == final_index:
                     disabled.discard(idx)
                     toggle_manual.discard(idx)
-                    continue
-                if not allow_disable:
-                    disabled.discard(idx)
-                    toggle_manual.discard(idx)
-                    continue
-                if idx not in toggle_manual:
+                elif idx not in toggle_manual:
                     disabled.add(idx)
+        self._defaults_version = self._pipeline_version
+
+    def _shift_stage_state(self, removed: int) -> None:
+        """Drop state for a removed stage and renumber the stages after it."""
+
+        index_sets = (self.output_manual_overrides, self.output_disabled, self.output_toggle_manual)
+        if removed == len(self.pipeline):
+            # The last stage went away: nothing to renumber, just drop its entries in place.
+            for mapping in self.output_overrides.values():
+                mapping.pop(removed, None)
+            for state in index_sets:
+                for indices in state.values():
+                    indices.discard(removed)
+            return
+
+        def shift(idx: int) -> int:
+            return idx - 1 if idx > removed else idx
+
+        for file_path, mapping in self.output_overrides.items():
+            self.output_overrides[file_path] = {
+                shift(idx): value for idx, value in mapping.items() if idx != removed
+            }
+        for state in index_sets:
+            for file_path, indices in state.items():
+                state[file_path] = {shift(idx) for idx in indices if idx != removed}
+
+    def relative_label(self, path: Path) -> str:
+        label = self.relative_labels.get(path)
+        if label is None:
+            label = str(path.relative_to(self.root)) if path.is_relative_to(self.root) else str(path)
+            self.relative_labels[path] = label
+        return label
 
     def _default_output_path(self, file_path: Path, stage_index: int) -> str:
-        suffix = file_path.suffix or ".md"
-        stem = file_path.stem
+        if self._default_path_version != self._pipeline_version:
+            self._default_path_cache = {}
+            self._default_path_version = self._pipeline_version
+        key = (file_path, stage_index)
+        cached = self._default_path_cache.get(key)
+        if cached is not None:
+            return cached
+        parts = self._output_path_parts.get(file_path)
+        if parts is None:
+            parts = (file_path.parent, file_path.stem, file_path.suffix or ".md")
+            self._output_path_parts[file_path] = parts
+        parent, stem, suffix = parts
         if stage_index == len(self.pipeline) - 1:
             tag = "_out_final"
         else:
             tag = f"_out_{stage_index + 1}"
-        return str(file_path.parent / f"{stem}{tag}{suffix}")
+        result = self._default_path_cache[key] = str(parent / f"{stem}{tag}{suffix}")
+        return result
 
     def update_output_override(self, file_path: Path, stage_index: int, path: str) -> None:
         mapping = self.output_overrides.setdefault(file_path, {})
@@ -249,34 +530,84 @@ class ToolManagerApp(App):
     def stage_requires_output(self, stage_index: int) -> bool:
         if not (0 <= stage_index < len(self.pipeline)):
             return False
-        stage = self.pipeline[stage_index]
         is_last = stage_index == len(self.pipeline) - 1
-        return stage.name in OUTPUT_FLAG_MAP or is_last
+        return is_last or self.pipeline[stage_index].name in OUTPUT_FLAG_KEYS
 
     def configurable_stage_indices(self) -> list[int]:
         return [idx for idx in range(len(self.pipeline)) if self.stage_requires_output(idx)]
 
+    def _compile_stages(self) -> list[tuple[StagePayload, str | None, int | None]]:
+        compiled = self._compiled_stages
+        if compiled is None:
+            compiled = []
+            for stage in self.pipeline:
+                args = tuple(stage.args)
+                flag = OUTPUT_FLAG_MAP.get(stage.name)
+                flag_index = args.index(flag) if flag and flag in args else None
+                # StagePayload is immutable, so stages without an override share one instance.
+                compiled.append((StagePayload(stage.name, args), flag, flag_index))
+            self._compiled_stages = compiled
+        return compiled
+
     def build_payloads(self) -> list[PipelinePayload]:
         payloads: list[PipelinePayload] = []
+        overrides_all = self.output_overrides
+        disabled_all = self.output_disabled
+        stage_payload = StagePayload
+        splice_flag = _splice_output_flag
+        compiled = self._compile_stages()
+        base_stages = tuple(base for base, _, _ in compiled)
+        flagged = [(index, flag, flag_index) for index, (_, flag, flag_index) in enumerate(compiled) if flag]
         for file_path in self.selected_files:
-            stages: list[StagePayload] = []
-            overrides = self.output_overrides.get(file_path, {})
-            disabled_indices = self.output_disabled.get(file_path, set())
-            for index, stage in enumerate(self.pipeline):
-                args = list(stage.args)
-                flag = OUTPUT_FLAG_MAP.get(stage.name)
+            stages: list[StagePayload] | None = None
+            overrides = overrides_all.get(file_path, EMPTY_OVERRIDES)
+            disabled_indices = disabled_all.get(file_path, EMPTY_INDICES)
+            for index, flag, flag_index in flagged:
+                if index in disabled_indices:
+                    continue
                 override_path = overrides.get(index)
-                if flag and override_path and index not in disabled_indices:
-                    args = apply_output_flag(args, flag, override_path)
-                stages.append(StagePayload(stage.name, tuple(args)))
-            payloads.append(PipelinePayload(input_path=file_path, stages=tuple(stages)))
+                if not override_path:
+                    continue
+                base = base_stages[index]
+                if stages is None:
+                    stages = list(base_stages)
+                stages[index] = stage_payload(
+                    base.stage_name, splice_flag(base.args, flag, flag_index, override_path)
+                )
+            # Files without any output override share the base stages tuple.
+            payloads.append(
+                PipelinePayload(input_path=file_path, stages=base_stages if stages is None else tuple(stages))
+            )
         return payloads
 
-    def run_selected_pipelines(self) -> str:
+    async def run_selected_pipelines(
+        self,
+        run_in_worker: WorkerRunner,
+        report_progress: ProgressReporter,
+    ) -> str:
         payloads = self.build_payloads()
         if not payloads:
             raise RuntimeError("No payloads to execute.")
-        results = self.tool_manager.run_payloads(payloads)
+        total = len(payloads)
+        finished = 0
+
+        async def run_one(payload: PipelinePayload) -> object:
+            nonlocal finished
+            try:
+                return await run_in_worker(self.tool_manager.run_payload, payload)
+            finally:
+                finished += 1
+                report_progress(f"{finished}/{total} finished: {payload.input_path.name}")
+
+        # Inputs are independent, so each runs as its own job; the worker pool caps concurrency.
+        results = await asyncio.gather(*(run_one(payload) for payload in payloads), return_exceptions=True)
+        failures = [
+            f"{payload.input_path.name}: {result}"
+            for payload, result in zip(payloads, results)
+            if isinstance(result, BaseException)
+        ]
+        if failures:
+            raise RuntimeError("; ".join(failures))
         return f"Executed {len(results)} pipeline(s)."
 
     def start_pipeline_run(self) -> None:
@@ -288,18 +619,14 @@ class ToolManagerApp(App):
         result_screen.start_run(self.run_selected_pipelines)
 
 
-def apply_output_flag(args: list[str], flag: str, path: str) -> list[str]:
+def apply_output_flag(args: tuple[str, ...], flag: str, path: str) -> tuple[str, ...]:
     """Ensure the given output flag uses the provided path."""
 
-    updated = list(args)
-    try:
-        index = updated.index(flag)
-    except ValueError:
-        updated.extend([flag, path])
-        return updated
-
-    if index + 1 < len(updated):
-        updated[index + 1] = path
-    else:
-        updated.append(path)
-    return updated
+    return _splice_output_flag(args, flag, args.index(flag) if flag in args else None, path)
+
+
+def _splice_output_flag(args: tuple[str, ...], flag: str, flag_index: int | None, path: str) -> tuple[str, ...]:
+    # ``flag_index`` comes precompiled from the pipeline, so no per-file scan is needed.
+    if flag_index is None:
+        return (*args, flag, path)
+    return args[: flag_index + 1] + (path,) + args[flag_index + 2 :]
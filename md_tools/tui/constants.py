@@ -1,10 +1,38 @@
 from __future__ import annotations
 
+import os
+from types import MappingProxyType
+from typing import Mapping
+
 OUTPUT_FLAG_MAP: dict[str, str] = {
     "split": "-o",
     "format-newlines": "--output",
     "combine": "--output",
     "translate-md": "--output",
 }
+# Tools that accept a stage-level output flag; frozenset for cheap membership tests.
+OUTPUT_FLAG_KEYS: frozenset[str] = frozenset(OUTPUT_FLAG_MAP)
+
+# Rows rendered per page in the file lists before a "load more" entry is shown.
+LIST_PAGE_SIZE = 200
+
+# Files handed from the background workspace scan to the UI per update.
+SCAN_BATCH_SIZE = 256
+
+# Upper bound on worker threads used to run pipelines from the TUI.
+PIPELINE_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Read-only defaults for files without per-stage output state; shared to avoid
+# allocating an empty container on every lookup miss.
+EMPTY_OVERRIDES: Mapping[int, str] = MappingProxyType({})
+EMPTY_INDICES: frozenset[int] = frozenset()
 
-__all__ = ["OUTPUT_FLAG_MAP"]
+__all__ = [
+    "EMPTY_INDICES",
+    "EMPTY_OVERRIDES",
+    "LIST_PAGE_SIZE",
+    "OUTPUT_FLAG_KEYS",
+    "OUTPUT_FLAG_MAP",
+    "PIPELINE_MAX_WORKERS",
+    "SCAN_BATCH_SIZE",
+]
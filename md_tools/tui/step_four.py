@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import io
-from contextlib import redirect_stderr, redirect_stdout
-from typing import TYPE_CHECKING, Callable
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable
 
 from textual import on
 from textual.app import ComposeResult
@@ -11,11 +16,113 @@ from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Static
 
+from ._capture import capture_thread_output
 from ._compat import TextLog
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from .app import ToolManagerApp
 
+# Longest match first so CRLF counts as a single line break.
+_LINE_BREAKS = re.compile(r"(\r\n|\r|\n)")
+
+# Runs ``func(*args)`` on a pipeline worker thread with its output captured.
+WorkerRunner = Callable[..., Awaitable[Any]]
+# Receives short progress notes (for example "1/3 finished: a.md") while the run is active.
+ProgressReporter = Callable[[str], None]
+PipelineCallable = Callable[[WorkerRunner, ProgressReporter], Awaitable[str]]
+
+
+class ScreenLogWriter(io.TextIOBase):
+    """Forwards whole lines so concurrent workers do not split each other's output.
+
+    Each worker gets its own writer, since the unfinished line belongs to one
+    thread. That line is held back through ``flush`` and only forwarded by
+    ``finish`` when the job ends. Lines queue up in a deque and a single drain
+    callback is scheduled on the event loop while it is non-empty, so a burst of
+    writes costs one wakeup.
+    """
+
+    def __init__(
+        self,
+        app: "ToolManagerApp",
+        screen: "StepFourScreen",
+        loop: asyncio.AbstractEventLoop,
+        cancelled: threading.Event,
+    ) -> None:
+        super().__init__()
+        # Bind once so each write is a single call, not two lookups.
+        self._call = app.call_from_thread
+        self._append = screen.append_log
+        self._flush = screen.flush_pending_log
+        self._loop = loop
+        # Set once a newer run replaces this one; its output is dropped from then on.
+        self._cancelled = cancelled
+        # Text after the last line break, kept as fragments until a break arrives.
+        self._pending: list[str] = []
+        self._chunks: deque[str] = deque()
+        self._lock = threading.Lock()
+        self._scheduled = False
+
+    def write(self, data: str) -> int:  # pragma: no cover - Textual integration
+        if not data or self._cancelled.is_set():
+            return len(data)
+        # Only the new data is searched, so a long unbroken line stays linear.
+        cut = max(data.rfind("\n"), data.rfind("\r")) + 1
+        if not cut:
+            self._pending.append(data)
+            return len(data)
+        if self._pending:
+            self._pending.append(data[:cut])
+            text = "".join(self._pending)
+            self._pending.clear()
+        else:
+            text = data[:cut]
+        if cut < len(data):
+            self._pending.append(data[cut:])
+        self._post(text)
+        return len(data)
+
+    def flush(self) -> None:  # pragma: no cover - Textual integration
+        # An unfinished line stays buffered: print(..., flush=True) from this job must
+        # not commit half a line that another job's output could then continue.
+        if self._cancelled.is_set():
+            self._pending.clear()
+            return
+        try:
+            # Runs after any drain already scheduled, so all output lands first.
+            self._call(self._flush)
+        except RuntimeError:
+            pass
+
+    def finish(self) -> None:  # pragma: no cover - Textual integration
+        """Forward the trailing unfinished line once the job is done, then flush."""
+
+        if self._pending and not self._cancelled.is_set():
+            # Terminate it so the next job's output starts on a line of its own.
+            self._pending.append("\n")
+            self._post("".join(self._pending))
+        self._pending.clear()
+        self.flush()
+
+    def _post(self, text: str) -> None:
+        with self._lock:
+            self._chunks.append(text)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        try:
+            self._loop.call_soon_threadsafe(self._drain)
+        except RuntimeError:  # pragma: no cover - loop closed during shutdown
+            pass
+
+    def _drain(self) -> None:
+        with self._lock:
+            text = "".join(self._chunks)
+            self._chunks.clear()
+            self._scheduled = False
+        if not self._cancelled.is_set():
+            self._append(text)
+
 
 class StepFourScreen(Screen):
     """Final page that surfaces pipeline execution results."""
@@ -23,6 +130,16 @@ class StepFourScreen(Screen):
     RUNNING_STATUS = "The selected pipelines are running. Logs and progress updates appear below."
     SUCCESS_STATUS = "Pipelines finished successfully. Review the output below."
     FAILURE_STATUS = "Pipeline failed. Review the log and rerun if needed."
+    PROGRESS_INTERVAL = 0.05
+    # Committed log lines are written to the widget in batches on this cadence,
+    # or straight away once this many characters are waiting.
+    LOG_FLUSH_INTERVAL = 0.05
+    LOG_FLUSH_THRESHOLD = 64 * 1024
+    # Only the most recent lines are kept for re-rendering the log. The widget is
+    # rebuilt from them once it holds twice as many, so it stays bounded too.
+    LOG_HISTORY_LIMIT = 5000
+    # Minimum seconds between two drawn frames of a carriage-return progress line.
+    REWRITE_INTERVAL = 0.033
 
     def __init__(self, initial_message: str = "Running pipelines...") -> None:
         super().__init__()
@@ -30,15 +147,28 @@ class StepFourScreen(Screen):
         self._default_message = initial_message
         self._status_text = self.RUNNING_STATUS
         self._complete = False
-        self._log_lines: list[str] = [initial_message] if initial_message else []
-        self._current_line = ""
-        self._rewrite_line = ""
+        self._log_lines: deque[str] = self._new_history(initial_message)
+        # Unfinished line and progress frame, kept as fragments and joined on commit;
+        # += on an attribute copies the whole string every time.
+        self._current_buf: list[str] = []
+        self._rewrite_buf: list[str] = []
         self._rewrite_visible = False
         self._in_rewrite = False
         self._pending_cr = False
-        self._pipeline_callable: Callable[[], str] | None = None
+        self._last_rewrite_ts = 0.0
+        self._frame_closed = False
+        self._rewrite_dirty = False
+        self._pending_writes: list[str] = []
+        self._pending_bytes = 0
+        self._widget_lines = 0
+        self._pipeline_callable: PipelineCallable | None = None
         self._run_task: asyncio.Task | None = None
+        self._progress_task: asyncio.Task | None = None
+        self._run_cancelled = threading.Event()
+        self._active_jobs: set[Future[Any]] = set()
         self._rerun_visible = False
+        # Set while another screen covers this one; widget updates wait for resume.
+        self._suspended = False
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -62,135 +192,264 @@ class StepFourScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
+        # Look the widgets up once; log writes and status changes reuse them.
+        self._log_widget = self.query_one("#run-log", TextLog)
+        self._status_label = self.query_one("#step4-status", Static)
+        self._finish_button = self.query_one("#finish-step4", Button)
+        self._rerun_button = self.query_one("#rerun-step4", Button)
+        self.set_interval(self.LOG_FLUSH_INTERVAL, self._on_log_timer)
+        self._sync_widgets()
+
+    def on_screen_suspend(self) -> None:
+        self._suspended = True
+        # The resume re-render covers anything still queued.
+        self._pending_writes = []
+        self._pending_bytes = 0
+
+    def on_screen_resume(self) -> None:
+        if not self._suspended:
+            return
+        self._suspended = False
+        if self.is_mounted:
+            self._sync_widgets()
+
+    def _ui_ready(self) -> bool:
+        return self.is_mounted and not self._suspended
+
+    def _sync_widgets(self) -> None:
         self._render_log()
-        self._set_status_text(self._status_text)
-        finish_btn = self.query_one("#finish-step4", Button)
-        finish_btn.disabled = not self._complete
+        self._status_label.update(self._status_text)
+        self._finish_button.disabled = not self._complete
         self._apply_rerun_visibility()
 
-    def start_run(self, pipeline_callable: Callable[[], str] | None = None) -> None:
+    def start_run(self, pipeline_callable: PipelineCallable | None = None) -> None:
         if pipeline_callable is not None:
             self._pipeline_callable = pipeline_callable
         if self._pipeline_callable is None:
             raise RuntimeError("No pipeline callable provided for StepFourScreen.")
-        if self._run_task and not self._run_task.done():
-            self._run_task.cancel()
+        previous_run = self._run_task if self._run_task and not self._run_task.done() else None
+        if previous_run is not None:
+            # Silence the superseded run's workers and drop its queued jobs.
+            self._run_cancelled.set()
+            previous_run.cancel()
+        if self._progress_task and not self._progress_task.done():
+            self._progress_task.cancel()
         self._prepare_for_run()
         textual_app: "ToolManagerApp" = self.app  # type: ignore[assignment]
         screen = self
-
-        class ScreenLogWriter(io.TextIOBase):
-            def __init__(self) -> None:
-                self._owner = textual_app
-                self._screen = screen
-
-            def write(self, data: str) -> int:  # pragma: no cover - Textual integration
-                if not data:
-                    return 0
-                try:
-                    self._owner.call_from_thread(self._screen.append_log, data)
-                except RuntimeError:
-                    return len(data)
-                return len(data)
-
-            def flush(self) -> None:  # pragma: no cover - Textual integration
-                try:
-                    self._owner.call_from_thread(self._screen.flush_pending_log)
-                except RuntimeError:
-                    pass
-
-        log_writer = ScreenLogWriter()
+        event_loop = asyncio.get_running_loop()
+        cancelled = self._run_cancelled = threading.Event()
+
+        async def run_in_worker(func: Callable[..., Any], *args: Any) -> Any:
+            log_writer = ScreenLogWriter(textual_app, screen, event_loop, cancelled)
+
+            def run_with_capture() -> Any:
+                if cancelled.is_set():
+                    raise RuntimeError("Run was superseded before this job started.")
+                with capture_thread_output(log_writer):
+                    try:
+                        return func(*args)
+                    finally:
+                        log_writer.finish()
+
+            # Submitted directly rather than through asyncio.to_thread: the workers read
+            # no context variables, so copying the context per call is pure overhead.
+            job = textual_app.submit_pipeline_job(run_with_capture)
+            screen._active_jobs.add(job)
+            job.add_done_callback(screen._active_jobs.discard)
+            return await asyncio.wrap_future(job, loop=event_loop)
+
+        progress: asyncio.Queue[str | None] = asyncio.Queue()
+        self._progress_task = asyncio.create_task(self._drain_progress(progress))
 
         async def runner() -> None:
+            if previous_run is not None:
+                with contextlib.suppress(asyncio.CancelledError):
+                    await previous_run
+                # Jobs that had already started cannot be interrupted; let them finish
+                # before this run competes with them for the worker pool.
+                await screen._wait_for_jobs()
             success = True
             message = ""
             try:
-                def run_with_capture() -> str:
-                    with redirect_stdout(log_writer), redirect_stderr(log_writer):
-                        return self._pipeline_callable()  # type: ignore[misc]
-
-                message = await asyncio.to_thread(run_with_capture)
+                message = await self._pipeline_callable(run_in_worker, progress.put_nowait)  # type: ignore[misc]
             except Exception as exc:  # pragma: no cover - runtime safeguard
                 success = False
                 message = f"Pipeline failed: {exc}"
             finally:
-                try:
-                    log_writer.flush()
-                except RuntimeError:
-                    pass
+                progress.put_nowait(None)
+            if screen._progress_task is not None:
+                await screen._progress_task
             screen.mark_complete(message, success)
 
         self._run_task = asyncio.create_task(runner())
 
+    async def _wait_for_jobs(self) -> None:
+        jobs = list(self._active_jobs)
+        if jobs:
+            await asyncio.gather(*(asyncio.wrap_future(job) for job in jobs), return_exceptions=True)
+
+    async def _drain_progress(self, queue: asyncio.Queue[str | None]) -> None:
+        while True:
+            latest = await queue.get()
+            # Coalesce bursts so the status line refreshes at most once per interval.
+            while latest is not None and not queue.empty():
+                latest = queue.get_nowait()
+            if latest is None:
+                return
+            self._set_status_text(f"{self.RUNNING_STATUS}\n{latest}")
+            await asyncio.sleep(self.PROGRESS_INTERVAL)
+
     def append_log(self, text: str) -> None:
         if not text:
             return
-        for char in text:
-            if self._pending_cr:
-                if char == "\n":
-                    self._handle_newline()
-                    self._pending_cr = False
-                    continue
-                self._start_rewrite()
-                self._pending_cr = False
-            if char == "\r":
-                self._pending_cr = True
-                continue
-            if char == "\n":
+        if not self._pending_cr and not self._in_rewrite and "\r" not in text:
+            # Plain newline-terminated output needs none of the rewrite handling.
+            self._append_plain(text)
+            return
+        if self._pending_cr:
+            # A carriage return ended the previous chunk: CRLF or the start of a rewrite.
+            self._pending_cr = False
+            if text[0] == "\n":
                 self._handle_newline()
-                continue
-            if self._in_rewrite:
-                self._rewrite_line += char
+                text = text[1:]
             else:
-                self._current_line += char
-        if self._in_rewrite and self._rewrite_line:
-            self._commit_rewrite_line(final=False)
+                self._carriage_return()
+        pieces = _LINE_BREAKS.split(text)
+        last_separator = len(pieces) - 2
+        # Even slots hold text runs, odd slots the line break that ended them.
+        for position, piece in enumerate(pieces):
+            if not position % 2:
+                if piece:
+                    if not self._in_rewrite:
+                        self._current_buf.append(piece)
+                    elif self._frame_closed:
+                        # A newer frame supersedes the previous one.
+                        self._rewrite_buf[:] = (piece,)
+                        self._frame_closed = False
+                        self._rewrite_dirty = True
+                    else:
+                        self._rewrite_buf.append(piece)
+                        self._rewrite_dirty = True
+            elif piece != "\r":
+                self._handle_newline()
+            elif position == last_separator and not pieces[-1]:
+                self._pending_cr = True
+            else:
+                self._carriage_return()
+        if self._rewrite_dirty:
+            # Frames arriving faster than the refresh cap wait for the log timer.
+            if time.monotonic() - self._last_rewrite_ts >= self.REWRITE_INTERVAL:
+                self._commit_rewrite_line(final=False)
+
+    def _append_plain(self, text: str) -> None:
+        lines = text.split("\n")
+        tail = lines.pop()
+        if lines:
+            if self._current_buf:
+                self._current_buf.append(lines[0])
+                lines[0] = "".join(self._current_buf)
+                self._current_buf.clear()
+            for line in lines:
+                self._write_line(line)
+        if tail:
+            self._current_buf.append(tail)
+
+    def _carriage_return(self) -> None:
+        if self._in_rewrite:
+            # Keep the finished frame until a non-empty one replaces it, so bursts
+            # of frames only draw the latest.
+            self._frame_closed = bool(self._rewrite_buf)
+        else:
+            self._start_rewrite()
 
     def flush_pending_log(self) -> None:
-        if self._pending_cr:
-            pass
-        if self._in_rewrite and self._rewrite_line:
+        if self._rewrite_dirty:
             self._commit_rewrite_line(final=False)
-        if self._current_line:
+        if self._current_buf:
             self._commit_current_line()
 
-    def _write_line(self, line: str, *, replace: bool = False) -> None:
+    def _new_history(self, initial_message: str) -> deque[str]:
+        return deque([initial_message] if initial_message else (), maxlen=self.LOG_HISTORY_LIMIT)
+
+    def _write_line(self, line: str, *, replace: bool = False, rewritable: bool = False) -> None:
         if replace and self._log_lines:
             self._log_lines[-1] = line
         else:
             self._log_lines.append(line)
-        if not self.is_mounted:
+        if not self._ui_ready():
             return
-        log = self.query_one("#run-log", TextLog)
-        if replace:
-            if hasattr(log, "clear"):
-                log.clear()
-            else:  # pragma: no cover - defensive fallback
-                for child in list(log.children):
-                    child.remove()
-            for existing in self._log_lines:
-                log.write(existing)
-        else:
-            log.write(line)
+        if replace or rewritable:
+            # Progress lines get their own widget line so later ticks can overwrite it.
+            self._flush_writes()
+            log = self._log_widget
+            if not replace:
+                log.write(line)
+                self._widget_lines += 1
+                self._compact_log()
+                return
+            replace_last_line = getattr(log, "replace_last_line", None)
+            if replace_last_line is None or not replace_last_line(line):
+                self._render_log()
+            return
+        self._pending_writes.append(line)
+        self._pending_bytes += len(line)
+        if self._pending_bytes > self.LOG_FLUSH_THRESHOLD:
+            self._flush_writes()
+
+    def _on_log_timer(self) -> None:
+        if self._rewrite_dirty:
+            self._commit_rewrite_line(final=False)
+        self._flush_writes()
+
+    def _flush_writes(self) -> None:
+        if not self._pending_writes:
+            return
+        batch = self._pending_writes
+        self._pending_writes = []
+        self._pending_bytes = 0
+        self._write_batch(self._log_widget, batch)
+        self._widget_lines += len(batch)
+        self._compact_log()
+
+    def _compact_log(self) -> None:
+        if self._widget_lines > 2 * self.LOG_HISTORY_LIMIT:
+            self._render_log()
 
     def _render_log(self) -> None:
-        log = self.query_one("#run-log", TextLog)
+        self._pending_writes = []
+        self._pending_bytes = 0
+        log = self._log_widget
         if hasattr(log, "clear"):
             log.clear()
         else:  # pragma: no cover - defensive fallback
-            for child in list(log.children):
-                child.remove()
-        for line in self._log_lines:
-            log.write(line)
+            log.remove_children()
+        lines = list(self._log_lines)
+        self._widget_lines = len(lines)
+        if self._rewrite_visible and lines:
+            # Keep the live progress line on its own so later frames can replace it.
+            self._write_batch(log, lines[:-1])
+            log.write(lines[-1])
+        else:
+            self._write_batch(log, lines)
+
+    @staticmethod
+    def _write_batch(log: TextLog, lines: Iterable[str]) -> None:
+        if not isinstance(lines, list):
+            lines = list(lines)
+        if not lines:
+            return
+        write_lines = getattr(log, "write_lines", None)
+        if write_lines is not None:
+            write_lines(lines)
+        else:  # pragma: no cover - Textual releases without write_lines
+            log.write("\n".join(lines))
 
     def _start_rewrite(self) -> None:
-        if self._current_line:
+        if self._current_buf:
             self._commit_current_line()
-        if self._in_rewrite and self._rewrite_line:
-            self._commit_rewrite_line(final=False)
         self._in_rewrite = True
-        self._rewrite_line = ""
-        self._current_line = ""
+        self._rewrite_buf.clear()
 
     def _handle_newline(self) -> None:
         if self._in_rewrite:
@@ -199,56 +458,62 @@ class StepFourScreen(Screen):
             self._commit_current_line(force=True)
 
     def _commit_rewrite_line(self, *, final: bool) -> None:
-        if not self._rewrite_line:
-            if final:
-                self._in_rewrite = False
-                self._rewrite_visible = False
-            return
-        self._write_line(self._rewrite_line, replace=self._rewrite_visible)
-        self._rewrite_line = ""
+        # The frame text is kept after drawing so output that continues it across
+        # chunks redraws the whole frame rather than just the new tail.
+        if self._rewrite_dirty and self._rewrite_buf:
+            frame = "".join(self._rewrite_buf)
+            # Keep the joined frame so the next redraw only joins the new fragments.
+            self._rewrite_buf[:] = (frame,)
+            self._write_line(frame, replace=self._rewrite_visible, rewritable=True)
+            self._rewrite_visible = True
+            self._last_rewrite_ts = time.monotonic()
+        self._rewrite_dirty = False
         if final:
             self._in_rewrite = False
             self._rewrite_visible = False
-        else:
-            self._rewrite_visible = True
+            self._rewrite_buf.clear()
+            self._frame_closed = False
 
     def _commit_current_line(self, *, force: bool = False) -> None:
-        if not self._current_line and not force:
+        if not self._current_buf and not force:
             return
-        self._write_line(self._current_line, replace=False)
-        self._current_line = ""
+        line = "".join(self._current_buf)
+        self._current_buf.clear()
+        self._write_line(line, replace=False)
 
     def _prepare_for_run(self) -> None:
         self._complete = False
         self._rerun_visible = False
         self._set_status_text(self.RUNNING_STATUS)
         self._reset_log_state(self._default_message)
-        if self.is_mounted:
-            finish_btn = self.query_one("#finish-step4", Button)
-            finish_btn.disabled = True
+        if self._ui_ready():
+            self._finish_button.disabled = True
             self._apply_rerun_visibility()
 
     def _reset_log_state(self, initial_message: str) -> None:
         self.message = initial_message
-        self._log_lines = [initial_message] if initial_message else []
-        self._current_line = ""
-        self._rewrite_line = ""
+        self._log_lines = self._new_history(initial_message)
+        self._current_buf.clear()
+        self._rewrite_buf.clear()
         self._rewrite_visible = False
         self._in_rewrite = False
+        self._frame_closed = False
+        self._rewrite_dirty = False
         self._pending_cr = False
-        if self.is_mounted:
+        if self._ui_ready():
             self._render_log()
 
     def _set_status_text(self, text: str) -> None:
+        if text == self._status_text:
+            return
         self._status_text = text
-        if self.is_mounted:
-            status_label = self.query_one("#step4-status", Static)
-            status_label.update(text)
+        if self._ui_ready():
+            self._status_label.update(text)
 
     def _apply_rerun_visibility(self) -> None:
-        if not self.is_mounted:
+        if not self._ui_ready():
             return
-        rerun_btn = self.query_one("#rerun-step4", Button)
+        rerun_btn = self._rerun_button
         rerun_btn.disabled = not self._rerun_visible
         rerun_btn.styles.display = "block" if self._rerun_visible else "none"
 
@@ -259,11 +524,11 @@ class StepFourScreen(Screen):
             self.append_log(f"{message}{suffix}")
         self.flush_pending_log()
         self._complete = True
+        self._rerun_visible = not success
         self._set_status_text(self.SUCCESS_STATUS if success else self.FAILURE_STATUS)
-        if self.is_mounted:
-            finish_btn = self.query_one("#finish-step4", Button)
-            finish_btn.disabled = False
-            self._rerun_visible = not success
+        if self._ui_ready():
+            self._flush_writes()
+            self._finish_button.disabled = False
             self._apply_rerun_visibility()
 
     @on(Button.Pressed, "#finish-step4")
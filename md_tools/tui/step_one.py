@@ -6,9 +6,12 @@ from typing import TYPE_CHECKING
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Horizontal, VerticalScroll
+from textual.message import Message
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, ListItem, ListView, Static
 
+from ._paging import LoadMoreItem
+from .constants import LIST_PAGE_SIZE
 from .step_two import StepTwoScreen
 
 if TYPE_CHECKING:  # pragma: no cover - type checking only
@@ -18,15 +21,30 @@ if TYPE_CHECKING:  # pragma: no cover - type checking only
 class StepOneScreen(Screen):
     """Screen that allows the user to pick Markdown files."""
 
+    class FilesDiscovered(Message):
+        """A batch of files found by the app's background workspace scan."""
+
+        def __init__(self, files: list[Path], *, done: bool) -> None:
+            self.files = files
+            self.done = done
+            super().__init__()
+
     def __init__(self) -> None:
         super().__init__()
         self.temp_selected: set[Path] = set()
+        # path -> (row label, label text after the selection marker)
+        self._items: dict[Path, tuple[Static, str]] = {}
+        self._item_paths: dict[ListItem, Path] = {}
+        self._rendered = 0
+        self._row_limit = LIST_PAGE_SIZE
+        self._load_more: LoadMoreItem | None = None
 
     def compose(self) -> ComposeResult:
         yield Header()
         yield VerticalScroll(
             Static("Step 1/4 – Select Markdown files", classes="step-title"),
             Static("Choose one or more .md files from the provided root directory.", classes="step-help"),
+            Static("Scanning workspace...", id="scan-status", classes="step-help"),
             ListView(id="file-list", classes="panel"),
             Horizontal(
                 Button("Cancel", id="cancel-step1"),
@@ -39,24 +57,68 @@ class StepOneScreen(Screen):
     def on_mount(self) -> None:
         app: "ToolManagerApp" = self.app  # type: ignore[assignment]
         self.temp_selected = set(app.selected_files)
+        # Bound once: labels are built per row, and self.app resolves a context var.
+        self._relative_label = app.relative_label
+        self._file_list = self.query_one("#file-list", ListView)
+        self._scan_status = self.query_one("#scan-status", Static)
         self.refresh_file_list()
+        self._update_scan_status()
 
-    def _label_for_path(self, path: Path) -> str:
-        app: "ToolManagerApp" = self.app  # type: ignore[assignment]
-        marker = "[x]" if path in self.temp_selected else "[ ]"
-        relative = path.relative_to(app.root) if path.is_relative_to(app.root) else path
-        return f"{marker} {relative}"
+    def _marker(self, path: Path) -> str:
+        return "[x]" if path in self.temp_selected else "[ ]"
 
     def refresh_file_list(self) -> None:
+        self._file_list.clear()
+        self._items = {}
+        self._item_paths = {}
+        self._rendered = 0
+        self._row_limit = LIST_PAGE_SIZE
+        self._load_more = None
+        self._sync_rows()
+
+    def _sync_rows(self) -> None:
+        """Render newly available files up to the row limit and keep the load-more entry last."""
+
         app: "ToolManagerApp" = self.app  # type: ignore[assignment]
-        list_view = self.query_one("#file-list", ListView)
-        for child in list(list_view.children):
-            child.remove()
-        for path in app.available_files:
-            label = Static(self._label_for_path(path), markup=False)
+        files = app.available_files
+        page = files[self._rendered : self._row_limit]
+        items: list[ListItem] = []
+        for path in page:
+            suffix = f" {self._relative_label(path)}"
+            label = Static(self._marker(path) + suffix, markup=False)
+            self._items[path] = (label, suffix)
             item = ListItem(label)
-            item.data = str(path)
-            list_view.append(item)
+            self._item_paths[item] = path
+            items.append(item)
+        self._rendered += len(page)
+        remaining = len(files) - self._rendered
+        next_count = min(remaining, LIST_PAGE_SIZE)
+        if self._load_more is not None and (items or not remaining):
+            self._load_more.remove()
+            self._load_more = None
+        if remaining:
+            if self._load_more is None:
+                self._load_more = LoadMoreItem(next_count, remaining)
+                items.append(self._load_more)
+            else:
+                self._load_more.set_counts(next_count, remaining)
+        if items:
+            self._file_list.extend(items)
+
+    def _update_scan_status(self) -> None:
+        app: "ToolManagerApp" = self.app  # type: ignore[assignment]
+        count = len(app.available_files)
+        if app.scan_complete:
+            self._scan_status.update(f"Found {count} Markdown file(s).")
+        else:
+            self._scan_status.update(f"Scanning workspace... {count} Markdown file(s) so far.")
+
+    @on(FilesDiscovered)
+    def handle_files_discovered(self, message: FilesDiscovered) -> None:
+        if not self.is_mounted:
+            return
+        self._sync_rows()
+        self._update_scan_status()
 
     @on(Button.Pressed, "#next-step1")
     def handle_next(self) -> None:
@@ -75,19 +137,19 @@ class StepOneScreen(Screen):
 
     @on(ListView.Selected, "#file-list")
     def handle_toggle(self, event: ListView.Selected) -> None:
-        data = getattr(event.item, "data", None)
-        if not data:
+        if isinstance(event.item, LoadMoreItem):
+            self._row_limit = self._rendered + LIST_PAGE_SIZE
+            self._sync_rows()
+            return
+        path = self._item_paths.get(event.item)
+        if path is None:
             return
-        path = Path(str(data))
         if path in self.temp_selected:
             self.temp_selected.remove(path)
         else:
             self.temp_selected.add(path)
-        self._update_item_marker(event.item, path)
-
-    def _update_item_marker(self, item: ListItem, path: Path) -> None:
-        try:
-            label = item.query_one(Static)
-        except Exception:  # pragma: no cover - Textual internals
-            return
-        label.update(self._label_for_path(path))
+        row = self._items.get(path)
+        if row is not None:
+            # Only the marker changes; the path text is reused as-is.
+            label, suffix = row
+            label.update(self._marker(path) + suffix)
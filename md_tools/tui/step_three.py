@@ -8,10 +8,12 @@ from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.message import Message
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Button, Footer, Header, Input, Label, ListItem, ListView, Static
 
 from ._compat import Rule
-from .constants import OUTPUT_FLAG_MAP
+from ._paging import LoadMoreItem
+from .constants import EMPTY_INDICES, EMPTY_OVERRIDES, LIST_PAGE_SIZE, OUTPUT_FLAG_KEYS
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from .app import ToolManagerApp
@@ -20,6 +22,9 @@ if TYPE_CHECKING:  # pragma: no cover - typing only
 class OutputField(Static):
     """Widget containing a label and editable path input."""
 
+    # Seconds of typing inactivity before an edited path is reported.
+    DEBOUNCE_DELAY = 0.15
+
     class Changed(Message):
         def __init__(self, sender: "OutputField", stage_index: int, path: str) -> None:
             self.stage_index = stage_index
@@ -51,51 +56,73 @@ class OutputField(Static):
         self._toggle_button_id = f"output-toggle-{self.stage_index}"
         self._body_id = f"output-body-{self.stage_index}"
         self._status_id = f"output-status-{self.stage_index}"
+        self._input = Input(value=self.value, id=self._input_id)
+        self._pending_value: str | None = None
+        self._debounce_timer: Timer | None = None
+        self._status = Static("", id=self._status_id, classes="output-status")
+        self._shown_status = ""
+        self._disabled_message: Static | None = None
+        self._toggle: Button | None = None
+        if self.allow_disable:
+            self._disabled_message = Static(
+                "This stage will not write an intermediate file.",
+                classes="output-disabled-message",
+            )
+            self._toggle = Button(
+                self._toggle_label(),
+                id=self._toggle_button_id,
+                variant="primary" if not self.enabled else "default",
+            )
 
     def compose(self) -> ComposeResult:
         label = Label(f"{self.stage_index + 1}. {self.stage_name}")
-        if self.allow_disable:
+        if self._toggle is not None:
             yield Horizontal(
                 label,
                 Static("", classes="output-field-spacer"),
-                Button(
-                    self._toggle_label(),
-                    id=self._toggle_button_id,
-                    variant="primary" if not self.enabled else "default",
-                ),
+                self._toggle,
                 classes="output-field-header",
             )
         else:
             yield Horizontal(label, classes="output-field-header")
-        yield Vertical(id=self._body_id)
-        yield Static("", id=self._status_id, classes="output-status")
+        # Both body widgets stay mounted; toggling only flips their display.
+        body = [self._input]
+        if self._disabled_message is not None:
+            body.insert(0, self._disabled_message)
+        yield Vertical(*body, id=self._body_id)
+        yield self._status
         yield Rule()
 
     def on_mount(self) -> None:
         self._render_body()
         self._update_state_feedback()
 
-    def _render_body(self) -> None:
-        body = self.query_one(f"#{self._body_id}", Vertical)
-        for child in list(body.children):
-            child.remove()
-        if self.allow_disable and not self.enabled:
-            body.mount(
-                Static(
-                    "This stage will not write an intermediate file.",
-                    classes="output-disabled-message",
-                )
-            )
+    def set_state(self, value: str, *, enabled: bool) -> None:
+        """Point an existing field at another file's output settings."""
+
+        self.value = value
+        self.enabled = enabled
+        self._sync_input_value()
+        self._render_body()
+        self._update_state_feedback()
+
+    def _sync_input_value(self) -> None:
+        if self._input.value == self.value:
             return
-        body.mount(Input(value=self.value, id=self._input_id))
+        # Programmatic updates must not be reported as user overrides.
+        with self._input.prevent(Input.Changed):
+            self._input.value = self.value
+
+    def _render_body(self) -> None:
+        show_input = not (self.allow_disable and not self.enabled)
+        self._input.display = show_input
+        if self._disabled_message is not None:
+            self._disabled_message.display = not show_input
 
     def _active_input(self) -> Input | None:
         if self.allow_disable and not self.enabled:
             return None
-        try:
-            return self.query_one(f"#{self._input_id}", Input)
-        except Exception:
-            return None
+        return self._input
 
     def _status_text(self) -> str:
         if not self.allow_disable:
@@ -105,19 +132,10 @@ class OutputField(Static):
         return "Intermediate output disabled."
 
     def _update_status(self) -> None:
-        try:
-            status = self.query_one(f"#{self._status_id}", Static)
-        except Exception:
-            return
-        status.update(self._status_text())
-
-    def _toggle_button(self) -> Button | None:
-        if not self.allow_disable:
-            return None
-        try:
-            return self.query_one(f"#{self._toggle_button_id}", Button)
-        except Exception:
-            return None
+        text = self._status_text()
+        if text != self._shown_status:
+            self._status.update(text)
+            self._shown_status = text
 
     def _toggle_label(self) -> str:
         return "Disable output" if self.enabled else "Emit output"
@@ -125,31 +143,55 @@ class OutputField(Static):
     def _update_state_feedback(self) -> None:
         self.set_class(self.allow_disable and not self.enabled, "output-field-disabled")
         self._update_status()
-        button = self._toggle_button()
+        button = self._toggle
         if button is not None:
-            button.label = self._toggle_label()
-            button.variant = "default" if self.enabled else "primary"
+            # Label and variant both follow ``enabled``; assigning either re-renders the button.
+            variant = "default" if self.enabled else "primary"
+            if button.variant != variant:
+                button.label = self._toggle_label()
+                button.variant = variant
 
     @on(Input.Changed)
     def handle_change(self, event: Input.Changed) -> None:
         if self.allow_disable and not self.enabled:
             return
+        if event.value == self.value:
+            # Echo of a value we already hold (e.g. the initial mount), not an edit.
+            return
         self.value = event.value
-        self.post_message(OutputField.Changed(self, self.stage_index, event.value))
+        self._pending_value = event.value
+        if self._debounce_timer is not None:
+            self._debounce_timer.stop()
+        self._debounce_timer = self.set_timer(self.DEBOUNCE_DELAY, self._emit_pending)
         self._update_status()
 
+    def take_pending(self) -> str | None:
+        """Return an edit that has not been reported yet and cancel its timer."""
+
+        if self._debounce_timer is not None:
+            self._debounce_timer.stop()
+            self._debounce_timer = None
+        value, self._pending_value = self._pending_value, None
+        return value
+
+    def _emit_pending(self) -> None:
+        value = self.take_pending()
+        if value is not None:
+            self.post_message(OutputField.Changed(self, self.stage_index, value))
+
     @on(Button.Pressed)
     def handle_toggle(self, event: Button.Pressed) -> None:
         if not self.allow_disable or event.button.id != self._toggle_button_id:
             return
         self.enabled = not self.enabled
-        self._render_body()
-        input_widget = self._active_input()
-        if input_widget is not None:
-            input_widget.value = self.value
-            input_widget.focus()
+        with self.app.batch_update():
+            self._render_body()
+            input_widget = self._active_input()
+            if input_widget is not None:
+                self._sync_input_value()
+                input_widget.focus()
+            self._update_state_feedback()
         self.post_message(OutputField.Toggled(self, self.stage_index, self.enabled))
-        self._update_state_feedback()
 
 
 class StepThreeScreen(Screen):
@@ -158,6 +200,10 @@ class StepThreeScreen(Screen):
     def __init__(self) -> None:
         super().__init__()
         self.current_file: Path | None = None
+        self._output_fields: dict[int, OutputField] = {}
+        self._field_layout: tuple[tuple[int, str, bool], ...] = ()
+        self._files_rendered = 0
+        self._item_paths: dict[ListItem, Path] = {}
 
     def compose(self) -> ComposeResult:
         app: "ToolManagerApp" = self.app  # type: ignore[assignment]
@@ -177,7 +223,8 @@ class StepThreeScreen(Screen):
                 ),
                 Vertical(
                     Static("Outputs"),
-                    VerticalScroll(id="output-editor", classes="panel"),
+                    # The first file's fields are composed in, not mounted after the screen.
+                    VerticalScroll(*self._initial_output_fields(app), id="output-editor", classes="panel"),
                     id="output-path-column",
                     classes="output-column",
                 ),
@@ -193,56 +240,116 @@ class StepThreeScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        app: "ToolManagerApp" = self.app  # type: ignore[assignment]
+        self._editor = self.query_one("#output-editor", VerticalScroll)
+        if self.current_file is not None:
+            self.query_one("#output-file-list", ListView).index = 0
+
+    def _initial_output_fields(self, app: "ToolManagerApp") -> list["OutputField"]:
         app.ensure_output_defaults()
-        file_list = self.query_one("#output-file-list", ListView)
-        if file_list.children:
-            first = file_list.children[0]
-            data = getattr(first, "data", "")
-            if data:
-                self.current_file = Path(str(data)).resolve()
-                file_list.index = 0
-                self.refresh_output_fields()
+        if not app.selected_files:
+            return []
+        self.current_file = app.selected_files[0]
+        return self._create_fields(self._field_specs(app, self.current_file))
 
     def refresh_output_fields(self) -> None:
         if not self.current_file:
             return
         app: "ToolManagerApp" = self.app  # type: ignore[assignment]
-        editor = self.query_one("#output-editor", VerticalScroll)
-        for child in list(editor.children):
-            child.remove()
-        overrides = app.output_overrides.get(self.current_file, {})
-        disabled = app.output_disabled.setdefault(self.current_file, set())
+        specs = self._field_specs(app, self.current_file)
+        if self._output_fields and self._layout_of(specs) == self._field_layout:
+            # Same stages as before: retarget the existing widgets at this file.
+            with self.app.batch_update():
+                for idx, _, value, _, enabled in specs:
+                    self._output_fields[idx].set_state(value, enabled=enabled)
+            return
+
+        editor = self._editor
+        editor.remove_children()
+        # One mount call lays the whole editor out once.
+        editor.mount_all(self._create_fields(specs))
+
+    @staticmethod
+    def _field_specs(app: "ToolManagerApp", file_path: Path) -> list[tuple[int, str, str, bool, bool]]:
+        overrides = app.output_overrides.get(file_path, EMPTY_OVERRIDES)
+        disabled = app.output_disabled.get(file_path, EMPTY_INDICES)
+        pipeline = app.pipeline
+        last_index = len(pipeline) - 1
+        specs: list[tuple[int, str, str, bool, bool]] = []
         for idx in app.configurable_stage_indices():
-            stage = app.pipeline[idx]
-            allow_disable = idx != len(app.pipeline) - 1 and stage.name in OUTPUT_FLAG_MAP
-            label = "Final Output" if idx == len(app.pipeline) - 1 else stage.name
-            value = overrides.get(idx, app._default_output_path(self.current_file, idx))
-            editor.mount(
-                OutputField(
-                    idx,
-                    label,
-                    value,
-                    allow_disable=allow_disable,
-                    enabled=idx not in disabled,
-                )
+            if idx == last_index:
+                label, allow_disable = "Final Output", False
+            else:
+                label = pipeline[idx].name
+                allow_disable = label in OUTPUT_FLAG_KEYS
+            value = overrides.get(idx)
+            if value is None:
+                value = app._default_output_path(file_path, idx)
+            specs.append((idx, label, value, allow_disable, idx not in disabled))
+        return specs
+
+    def _create_fields(self, specs: list[tuple[int, str, str, bool, bool]]) -> list["OutputField"]:
+        self._output_fields = {
+            idx: OutputField(
+                idx,
+                label,
+                value,
+                allow_disable=allow_disable,
+                enabled=enabled,
             )
+            for idx, label, value, allow_disable, enabled in specs
+        }
+        self._field_layout = self._layout_of(specs)
+        return list(self._output_fields.values())
+
+    @staticmethod
+    def _layout_of(specs: list[tuple[int, str, str, bool, bool]]) -> tuple[tuple[int, str, bool], ...]:
+        return tuple((idx, label, allow_disable) for idx, label, _, allow_disable, _ in specs)
+
+    def flush_pending_outputs(self) -> None:
+        """Store edits still waiting on their debounce timer for the current file."""
+
+        if not self.current_file:
+            return
+        app: "ToolManagerApp" = self.app  # type: ignore[assignment]
+        for idx, field in self._output_fields.items():
+            value = field.take_pending()
+            if value is not None:
+                app.update_output_override(self.current_file, idx, value)
 
     def _build_output_file_list(self, app: "ToolManagerApp") -> ListView:
+        return ListView(*self._next_file_page(app), id="output-file-list", classes="panel")
+
+    def _next_file_page(self, app: "ToolManagerApp") -> list[ListItem]:
+        files = app.selected_files
+        page = files[self._files_rendered : self._files_rendered + LIST_PAGE_SIZE]
         items: list[ListItem] = []
-        for path in app.selected_files:
-            label = Static(str(path.relative_to(app.root)))
-            item = ListItem(label)
-            item.data = str(path)
+        relative_label = app.relative_label
+        for path in page:
+            item = ListItem(Static(relative_label(path), markup=False))
+            self._item_paths[item] = path
             items.append(item)
-        return ListView(*items, id="output-file-list", classes="panel")
+        self._files_rendered += len(page)
+        remaining = len(files) - self._files_rendered
+        if remaining:
+            items.append(LoadMoreItem(min(remaining, LIST_PAGE_SIZE), remaining))
+        return items
+
+    @on(ListView.Selected, "#output-file-list")
+    def on_load_more(self, event: ListView.Selected) -> None:
+        if not isinstance(event.item, LoadMoreItem):
+            return
+        app: "ToolManagerApp" = self.app  # type: ignore[assignment]
+        event.item.remove()
+        event.list_view.extend(self._next_file_page(app))
 
     @on(ListView.Highlighted, "#output-file-list")
     def on_file_selected(self, event: ListView.Highlighted) -> None:
-        data = event.item.data
-        if data:
-            self.current_file = Path(str(data)).resolve()
-            self.refresh_output_fields()
+        selected = self._item_paths.get(event.item) if event.item is not None else None
+        if selected is None or selected == self.current_file:
+            return
+        self.flush_pending_outputs()
+        self.current_file = selected
+        self.refresh_output_fields()
 
     @on(OutputField.Changed)
     def on_output_changed(self, event: OutputField.Changed) -> None:
@@ -264,8 +371,10 @@ class StepThreeScreen(Screen):
         if not app.pipeline or not app.selected_files:
             self.app.bell()
             return
+        self.flush_pending_outputs()
         app.start_pipeline_run()
 
     @on(Button.Pressed, "#back-step3")
     def handle_back(self) -> None:
+        self.flush_pending_outputs()
         self.app.pop_screen()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 import shlex
 from typing import TYPE_CHECKING
 
@@ -12,19 +13,41 @@ from textual.widgets import Button, Footer, Header, Input, ListItem, ListView, S
 from .step_three import StepThreeScreen
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
-    from .app import ToolManagerApp
+    from .app import PipelineStageModel, ToolManagerApp
+
+
+# Printable ASCII without quotes or backslashes, separated only by the whitespace
+# shlex splits on. str.split() tokenizes such input exactly like shlex; it would
+# also break on characters such as NBSP or U+2028 that shlex keeps inside a word.
+_PLAIN_ARGS = re.compile(r"[ \t\r\n!#-&(-\[\]-~]*")
+_OUTPUT_FLAGS = frozenset({"-o", "--output"})
+_OUTPUT_FLAG_PREFIXES = ("--output=", "-o=")
+
+
+def split_stage_args(value: str) -> list[str]:
+    """Tokenize stage arguments; only input shlex could treat differently goes through it."""
+
+    raw = value.strip()
+    if not raw:
+        return []
+    if _PLAIN_ARGS.fullmatch(raw):
+        return raw.split()
+    return shlex.split(raw)
 
 
 class StepTwoScreen(Screen):
     """Pipeline construction UI."""
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._last_graph: str | None = None
+        # Row widgets in pipeline order, so edits touch only the affected rows.
+        self._stage_items: list[ListItem] = []
+        self._stage_labels: list[Static] = []
+
     def _build_tool_list(self, app: "ToolManagerApp") -> ListView:
-        items: list[ListItem] = []
-        for index, tool_name in enumerate(app.tool_names):
-            static = Static(tool_name)
-            list_item = ListItem(static, id=f"tool-{index}")
-            list_item.data = tool_name
-            items.append(list_item)
+        # Rows follow app.tool_names, so the highlighted row index is the tool index.
+        items = [ListItem(Static(tool_name, markup=False)) for tool_name in app.tool_names]
         return ListView(*items, id="tool-list", classes="panel")
 
     def compose(self) -> ComposeResult:
@@ -59,67 +82,85 @@ class StepTwoScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
+        # Cached once; the refresh and error paths run on every pipeline edit.
+        self._pipeline_list = self.query_one("#pipeline-list", ListView)
+        self._pipeline_graph = self.query_one("#pipeline-graph", Static)
+        self._error_label = self.query_one("#step2-error", Static)
+        self._tool_list = self.query_one("#tool-list", ListView)
+        self._args_field = self.query_one("#tool-args", Input)
         self.refresh_pipeline_view()
 
     def refresh_pipeline_view(self) -> None:
         app: "ToolManagerApp" = self.app  # type: ignore[assignment]
-        list_view = self.query_one("#pipeline-list", ListView)
-        for child in list(list_view.children):
-            child.remove()
-        for index, stage in enumerate(app.pipeline):
-            display = f"{index + 1}. {stage.name} {' '.join(stage.args)}".strip()
-            item = ListItem(Static(display))
-            item.data = index
-            list_view.append(item)
-        graph = " -> ".join(["input"] + [stage.name for stage in app.pipeline]) or "input"
-        self.query_one("#pipeline-graph", Static).update(graph)
+        list_view = self._pipeline_list
+        list_view.clear()
+        self._stage_items = []
+        self._stage_labels = []
+        # Rows follow pipeline order, so the highlighted row index is the stage index.
+        list_view.extend([self._new_stage_row(index, stage) for index, stage in enumerate(app.pipeline)])
+        self._refresh_graph()
+
+    def _new_stage_row(self, index: int, stage: "PipelineStageModel") -> ListItem:
+        label = Static(self._stage_text(index, stage), markup=False)
+        item = ListItem(label)
+        self._stage_labels.append(label)
+        self._stage_items.append(item)
+        return item
+
+    @staticmethod
+    def _stage_text(index: int, stage: "PipelineStageModel") -> str:
+        return f"{index + 1}. {stage.name} {' '.join(stage.args)}".strip()
+
+    def _append_stage_row(self) -> None:
+        app: "ToolManagerApp" = self.app  # type: ignore[assignment]
+        self._pipeline_list.append(self._new_stage_row(len(app.pipeline) - 1, app.pipeline[-1]))
+        self._refresh_graph()
+
+    def _remove_stage_row(self, index: int) -> None:
+        app: "ToolManagerApp" = self.app  # type: ignore[assignment]
+        self._stage_labels.pop(index)
+        self._stage_items.pop(index).remove()
+        self._pipeline_list.index = None
+        # Later rows moved up one slot; only their numbering changes.
+        for position in range(index, len(self._stage_labels)):
+            self._stage_labels[position].update(self._stage_text(position, app.pipeline[position]))
+        self._refresh_graph()
+
+    def _refresh_graph(self) -> None:
+        app: "ToolManagerApp" = self.app  # type: ignore[assignment]
+        graph = app.pipeline_graph
+        if graph != self._last_graph:
+            self._pipeline_graph.update(graph)
+            self._last_graph = graph
 
     @on(Button.Pressed, "#add-stage")
     def handle_add_stage(self) -> None:
         app: "ToolManagerApp" = self.app  # type: ignore[assignment]
-        tool_list = self.query_one("#tool-list", ListView)
-        if tool_list.index is None:
-            self.app.bell()
-            return
-        try:
-            selected_item = tool_list.children[tool_list.index]
-        except (IndexError, TypeError):
+        tool_index = self._tool_list.index
+        if tool_index is None or not 0 <= tool_index < len(app.tool_names):
             self.app.bell()
             return
-        tool_name = str(getattr(selected_item, "data", ""))
-        if not tool_name:
-            self.app.bell()
-            return
-        args_field = self.query_one("#tool-args", Input)
-        args_value = args_field.value.strip()
-        args = shlex.split(args_value) if args_value else []
+        tool_name = app.tool_names[tool_index]
+        args_field = self._args_field
+        args = split_stage_args(args_field.value)
         if self._args_include_output(args):
             self._set_error("Remove -o/--output flags here. Configure outputs in Step 3.")
             self.app.bell()
             return
         app.add_stage(tool_name, args)
         args_field.value = ""
-        self.refresh_pipeline_view()
+        self._append_stage_row()
         self._set_error("")
 
     @on(Button.Pressed, "#remove-stage")
     def handle_remove_stage(self) -> None:
         app: "ToolManagerApp" = self.app  # type: ignore[assignment]
-        list_view = self.query_one("#pipeline-list", ListView)
-        if list_view.index is None:
-            self.app.bell()
-            return
-        try:
-            selected_item = list_view.children[list_view.index]
-        except (IndexError, TypeError):
-            self.app.bell()
-            return
-        stage_index = int(getattr(selected_item, "data", -1))
-        if stage_index == -1:
+        stage_index = self._pipeline_list.index
+        if stage_index is None or not 0 <= stage_index < len(app.pipeline):
             self.app.bell()
             return
         app.remove_stage(stage_index)
-        self.refresh_pipeline_view()
+        self._remove_stage_row(stage_index)
         self._set_error("")
 
     @on(Button.Pressed, "#next-step2")
@@ -140,8 +181,7 @@ class StepTwoScreen(Screen):
         self.app.pop_screen()
 
     def _set_error(self, message: str) -> None:
-        error_label = self.query_one("#step2-error", Static)
-        error_label.update(message)
+        self._error_label.update(message)
 
     def _validate_pipeline_outputs(self, app: "ToolManagerApp") -> bool:
         for stage in app.pipeline:
@@ -156,10 +196,7 @@ class StepTwoScreen(Screen):
     @staticmethod
     def _args_include_output(args: list[str]) -> bool:
         for arg in args:
-            normalized = arg.strip()
-            normalized_lower = normalized.lower()
-            if normalized_lower in ("-o", "--output"):
-                return True
-            if normalized_lower.startswith("--output=") or normalized_lower.startswith("-o="):
+            normalized = arg.strip().lower()
+            if normalized in _OUTPUT_FLAGS or normalized.startswith(_OUTPUT_FLAG_PREFIXES):
                 return True
         return False
@@ -1,23 +1,13 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Sequence
-
 
 def detect_newline(text: str) -> str:
     """Detect the dominant newline sequence in the given text."""
 
-    if "\r\n" in text:
+    # LF-only text (the common case) is scanned once; any CRLF still wins over bare CR.
+    index = text.find("\r")
+    if index < 0:
+        return "\n"
+    if text.startswith("\n", index + 1) or text.find("\r\n", index + 1) >= 0:
         return "\r\n"
-    if "\r" in text:
-        return "\r"
-    return "\n"
-
-
-def normalise_paragraph_newlines(paragraphs: List[str], newline: str) -> List[str]:
-    """Return paragraphs with internal newlines converted to the requested style."""
-
-    if newline == "\n":
-        return paragraphs
-    return [paragraph.replace("\n", newline) for paragraph in paragraphs]
-
-
+    return "\r"
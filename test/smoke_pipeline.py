@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import subprocess
 import sys
@@ -8,19 +9,29 @@ from pathlib import Path
 from typing import Callable, Iterable, Optional, Tuple
 
 
+def merged_env(env: Optional[dict[str, str]]) -> Optional[dict[str, str]]:
+    # None lets the child inherit os.environ without copying it.
+    return {**os.environ, **env} if env else None
+
+
 def run(cmd: list[str], *, env: Optional[dict[str, str]] = None) -> tuple[int, str, str]:
-    run_env = os.environ.copy()
-    if env:
-        run_env.update(env)
-    proc = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        env=run_env,
+    proc = subprocess.run(cmd, capture_output=True, text=True, env=merged_env(env), check=False)
+    return proc.returncode, proc.stdout, proc.stderr
+
+
+async def run_async(cmd: list[str], *, env: Optional[dict[str, str]] = None) -> tuple[int, str, str]:
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=merged_env(env),
+    )
+    out, err = await proc.communicate()
+    return (
+        proc.returncode if proc.returncode is not None else -1,
+        out.decode("utf-8", errors="replace"),
+        err.decode("utf-8", errors="replace"),
     )
-    out, err = proc.communicate()
-    return proc.returncode, out, err
 
 
 def cleanup_paths(paths: Iterable[Path]) -> None:
@@ -42,23 +53,62 @@ class SmokeScenario:
     env: Optional[dict[str, str]] = None
     setup: Optional[Callable[[], None]] = None
     cleanup: Optional[Callable[[], None]] = None
+    # Name of a scenario that must finish first because both touch the same files.
+    after: Optional[str] = None
 
 
-def run_scenario(scenario: SmokeScenario) -> ScenarioResult:
+async def run_scenario(scenario: SmokeScenario) -> ScenarioResult:
     try:
         if scenario.setup:
-            scenario.setup()
-        rc, out, err = run(scenario.command_factory(), env=scenario.env)
+            # Setup hooks are synchronous (some spawn their own prep command).
+            await asyncio.get_running_loop().run_in_executor(None, scenario.setup)
+        rc, out, err = await run_async(scenario.command_factory(), env=scenario.env)
         return scenario.validator(rc, out, err)
     finally:
         if scenario.cleanup:
             scenario.cleanup()
 
 
+async def run_chain(chain: list[SmokeScenario]) -> list[ScenarioResult]:
+    results: list[ScenarioResult] = []
+    for scenario in chain:
+        try:
+            results.append(await run_scenario(scenario))
+        except Exception as exc:  # pragma: no cover - defensive
+            results.append(("FAIL", f"{exc}"))
+    return results
+
+
+async def run_scenarios(scenarios: list[SmokeScenario]) -> dict[str, ScenarioResult]:
+    chains = chain_scenarios(scenarios)
+    chain_results = await asyncio.gather(*(run_chain(chain) for chain in chains))
+    results: dict[str, ScenarioResult] = {}
+    for chain, outcomes in zip(chains, chain_results):
+        for scenario, result in zip(chain, outcomes):
+            results[scenario.name] = result
+    return results
+
+
+def chain_scenarios(scenarios: list[SmokeScenario]) -> list[list[SmokeScenario]]:
+    chains: list[list[SmokeScenario]] = []
+    chain_by_name: dict[str, list[SmokeScenario]] = {}
+    for scenario in scenarios:
+        chain = chain_by_name.get(scenario.after) if scenario.after else None
+        if chain is None:
+            chain = []
+            chains.append(chain)
+        chain.append(scenario)
+        chain_by_name[scenario.name] = chain
+    return chains
+
+
 def main() -> int:
     repo_root = Path(__file__).resolve().parents[1]
     compat = [sys.executable, str(repo_root / "split_markdown.py")]
     fcfs_path = repo_root / "test" / "FCFS.md"
+    if not fcfs_path.is_file():
+        print(f"Skipping smoke tests: fixture {fcfs_path} not found.")
+        return 0
     fcfs = str(fcfs_path)
     fcfs_markers = ["Oliver Hart", "Library of Congress"]
     fake_translate_env = {"MD_TOOL_FAKE_TRANSLATE": "stub"}
@@ -238,6 +288,7 @@ def main() -> int:
                 str(combine_cli_out),
             ],
             setup=combine_setup,
+            after="CLI: split",
             cleanup=cleanup_factory([combine_cli_out, *split_cli_parts]),
             validator=lambda rc, _out, err: (
                 ("FAIL", f"rc={rc}, stderr={err.strip()}")
@@ -540,13 +591,13 @@ def main() -> int:
         )
     )
 
+    # Scenarios are subprocess-bound, so they overlap on one event loop; chains
+    # keep scenarios that share output files sequential.
+    results = asyncio.run(run_scenarios(scenarios))
+
     for scenario in scenarios:
-        try:
-            status, detail = run_scenario(scenario)
-        except Exception as exc:  # pragma: no cover - defensive
-            add_report(scenario.name, "FAIL", f"{exc}")
-        else:
-            add_report(scenario.name, status, detail)
+        status, detail = results[scenario.name]
+        add_report(scenario.name, status, detail)
 
     print("---- Smoke Test Report ----")
     for status, name, detail in reports:
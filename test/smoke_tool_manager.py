@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import io
 import os
 import sys
-from dataclasses import dataclass
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import cached_property
 from pathlib import Path
 from typing import Callable, Iterable, List, Sequence
 
@@ -13,6 +17,7 @@ if str(REPO_ROOT) not in sys.path:
 
 from md_tools.pipeline import MarkdownArtifact, PipelineDefinition
 from md_tools.tool_manager import PipelinePayload, StagePayload, ToolManager
+from md_tools.tui._capture import capture_thread_output
 
 MARKERS = ["Oliver Hart", "Library of Congress"]
 TRANSLATE_ARGS: tuple[str, ...] = (
@@ -33,18 +38,33 @@ TRANSLATE_ARGS: tuple[str, ...] = (
 os.environ.setdefault("MD_TOOL_FAKE_TRANSLATE", "stub")
 INPUT_PATH = REPO_ROOT / "test" / "FCFS.md"
 TRANSLATE_BASE_ARGS: List[str] = [str(arg) for arg in TRANSLATE_ARGS[1:]]
+SCRATCH_ROOT = "/dev/shm" if Path("/dev/shm").is_dir() else None
 
 
 def cleanup(paths: Iterable[Path]) -> None:
+    # One directory listing per parent finds the artifacts that actually exist, so
+    # missing ones cost neither a failed unlink nor an exception.
+    names_by_parent: dict[Path, set[str]] = {}
     for path in paths:
+        names_by_parent.setdefault(path.parent, set()).add(path.name)
+    for parent, names in names_by_parent.items():
         try:
-            path.unlink()
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    if entry.name in names:
+                        os.unlink(entry.path)
         except FileNotFoundError:
             continue
 
 
+_SLUG_TABLE = {code: chr(code).lower() if chr(code).isalnum() else "_" for code in range(128)}
+
+
 def slugify(value: str) -> str:
-    cleaned = "".join(char.lower() if char.isalnum() else "_" for char in value).strip("_")
+    if value.isascii():
+        cleaned = value.translate(_SLUG_TABLE).strip("_")
+    else:
+        cleaned = "".join(char.lower() if char.isalnum() else "_" for char in value).strip("_")
     return cleaned or "scenario"
 
 
@@ -68,6 +88,11 @@ def stage_entry(stage_name: str, *args: object) -> StagePayload:
     return StagePayload(stage_name=stage_name, args=tuple(str(arg) for arg in args))
 
 
+# Argument-free stages are immutable, so every builder shares one payload each.
+FORMAT_NEWLINES_STAGE = stage_entry("format-newlines")
+COMBINE_STAGE = stage_entry("combine")
+
+
 def build_format_split_segments(
     scenario: "ManagerScenario", slug: str, *, use_parts_flag: bool
 ) -> List[StagePayload]:
@@ -78,7 +103,7 @@ def build_format_split_segments(
     else:
         split_args = [scenario.split_parts, "-o", split_base]
     return [
-        stage_entry("format-newlines"),
+        FORMAT_NEWLINES_STAGE,
         stage_entry("split", *split_args),
         stage_entry("combine", "--output", final_output),
     ]
@@ -89,7 +114,7 @@ def build_split_combine_format_segments(scenario: "ManagerScenario", slug: str)
     final_output = scenario.artifact_path(slug, "final")
     return [
         stage_entry("split", scenario.split_parts, "-o", split_base),
-        stage_entry("combine"),
+        COMBINE_STAGE,
         stage_entry("format-newlines", "--output", final_output),
     ]
 
@@ -97,7 +122,7 @@ def build_split_combine_format_segments(scenario: "ManagerScenario", slug: str)
 def build_format_combine_segments(scenario: "ManagerScenario", slug: str) -> List[StagePayload]:
     final_output = scenario.artifact_path(slug, "final")
     return [
-        stage_entry("format-newlines"),
+        FORMAT_NEWLINES_STAGE,
         stage_entry("combine", "--output", final_output),
     ]
 
@@ -116,7 +141,7 @@ def build_format_translate_segments(scenario: "ManagerScenario", slug: str) -> L
     debug_output = scenario.artifact_path(slug, "translate_debug", ".json")
     translate_tokens = TRANSLATE_BASE_ARGS + ["--output", final_output, "--debug-output", debug_output]
     return [
-        stage_entry("format-newlines"),
+        FORMAT_NEWLINES_STAGE,
         stage_entry("translate-md", *translate_tokens),
     ]
 
@@ -159,10 +184,20 @@ class ManagerScenario:
     validator: Validator | None = None
     setup: SetupFunc | None = None
     batch_size: int = 1
+    artifact_dir: Path = REPO_ROOT / "test"
+    _paths: dict[tuple[str, str, str], Path] = field(default_factory=dict, init=False, repr=False)
+
+    @cached_property
+    def slug(self) -> str:
+        return slugify(self.name)
 
     def artifact_path(self, slug: str, label: str, ext: str | None = None) -> Path:
         extension = ext if ext is not None else ".md"
-        return REPO_ROOT / "test" / f"smoke_tool_manager_{slug}_{label}{extension}"
+        key = (slug, label, extension)
+        path = self._paths.get(key)
+        if path is None:
+            path = self._paths[key] = self.artifact_dir / f"smoke_tool_manager_{slug}_{label}{extension}"
+        return path
 
     def markers(self) -> Sequence[str]:
         return self.expect_markers if self.expect_markers is not None else MARKERS
@@ -243,10 +278,11 @@ def validate_scenario(
     if final_output is None or not final_output.is_file():
         return False, "final output file was not created"
 
-    text = final_output.read_text(encoding="utf-8")
+    # Markers are matched on the raw bytes; only custom validators need decoded text.
+    data = final_output.read_bytes()
     markers = scenario.markers()
     if markers:
-        missing = [marker for marker in markers if marker not in text]
+        missing = [marker for marker in markers if marker.encode("utf-8") not in data]
         if missing:
             return False, "missing markers: " + ", ".join(missing)
 
@@ -256,7 +292,7 @@ def validate_scenario(
                 return False, f"missing stage output for {stage.name}: {path}"
 
     if scenario.validator:
-        ok, detail = scenario.validator(pipeline_definition, artifact, text)
+        ok, detail = scenario.validator(pipeline_definition, artifact, data.decode("utf-8"))
         if not ok:
             return False, detail
 
@@ -273,8 +309,7 @@ def run_scenario(manager: ToolManager, scenario: ManagerScenario) -> tuple[bool,
     slugs: list[str] = []
 
     for index in range(1, scenario.batch_size + 1):
-        suffix = None if scenario.batch_size == 1 else f"batch_{index}"
-        slug = slugify(scenario.name if suffix is None else f"{scenario.name}_{suffix}")
+        slug = scenario.slug if scenario.batch_size == 1 else slugify(f"{scenario.name}_batch_{index}")
         slugs.append(slug)
         payload = scenario.build_payload(slug)
         payloads.append(payload)
@@ -308,31 +343,49 @@ def run_scenario(manager: ToolManager, scenario: ManagerScenario) -> tuple[bool,
         cleanup(cleanup_targets + extra_cleanup)
 
 
-def run_smoke() -> tuple[bool, list[tuple[str, str, str]]]:
+def run_scenario_captured(manager: ToolManager, scenario: ManagerScenario) -> tuple[bool, str, str]:
+    # Stage output is kept per scenario so concurrent scenarios cannot interleave it.
+    log = io.StringIO()
+    with capture_thread_output(log):
+        success, detail = run_scenario(manager, scenario)
+    return success, detail, log.getvalue()
+
+
+def report(label: str, name: str, detail: str) -> None:
+    message = f"[{label}] {name}"
+    if detail:
+        message += f" - {detail}"
+    print(" ", message, flush=True)
+
+
+def run_smoke() -> bool:
     manager = ToolManager()
-    reports: list[tuple[str, str, str]] = []
     failures = 0
 
-    for scenario in SCENARIOS:
-        success, detail = run_scenario(manager, scenario)
-        label = "PASS" if success else "FAIL"
-        reports.append((label, scenario.name, detail))
-        if not success:
-            failures += 1
-
-    return failures == 0, reports
+    print("---- Tool Manager Smoke Report ----", flush=True)
+    # Artifacts go to a scratch directory (RAM-backed where /dev/shm exists) that is
+    # dropped in one go, instead of the repository's test/ folder.
+    with tempfile.TemporaryDirectory(prefix="md_smoke_", dir=SCRATCH_ROOT) as scratch:
+        scenarios = [replace(scenario, artifact_dir=Path(scratch)) for scenario in SCENARIOS]
+        # Every scenario writes to its own slug-named artifacts, and ToolManager runs are
+        # thread-safe, so scenarios overlap. map() yields in order, so each scenario's log
+        # and result are printed together as soon as it and everything before it finished.
+        with ThreadPoolExecutor(max_workers=min(len(scenarios), os.cpu_count() or 1)) as executor:
+            results = executor.map(lambda scenario: run_scenario_captured(manager, scenario), scenarios)
+            for scenario, (success, detail, log) in zip(scenarios, results):
+                sys.stdout.write(log)
+                report("PASS" if success else "FAIL", scenario.name, detail)
+                if not success:
+                    failures += 1
+
+    return failures == 0
 
 
 def main() -> int:
-    success, reports = run_smoke()
-    print("---- Tool Manager Smoke Report ----")
-    for label, name, detail in reports:
-        message = f"[{label}] {name}"
-        if detail:
-            message += f" - {detail}"
-        print(" ", message)
-
-    if not success:
+    if not INPUT_PATH.is_file():
+        print(f"Skipping tool manager smoke tests: fixture {INPUT_PATH} not found.")
+        return 0
+    if not run_smoke():
         print("At least one tool manager scenario failed.")
         return 1
 
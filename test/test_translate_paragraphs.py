@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import List
 
 from md_tools.format_newlines import FormatNewlinesTool
-from md_tools.paragraphs import collect_paragraphs_with_metadata
+from md_tools.paragraphs import collect_paragraphs, collect_paragraphs_with_metadata
 
 
 def _non_blank(metadata: List[dict]) -> List[dict]:
@@ -61,7 +61,12 @@ def test_collect_paragraphs_identifies_varied_structures() -> None:
         "text",
     ]
 
-    table_entry = next(entry for entry in entries if entry["type"] == "table")
+    # First entry of each kind, indexed once instead of rescanning per lookup.
+    by_type: dict = {}
+    for entry in entries:
+        by_type.setdefault(entry["type"], entry)
+
+    table_entry = by_type["table"]
     assert table_entry["lines"] == [
         "| Name | Age |",
         "| ---- | --- |",
@@ -69,26 +74,26 @@ def test_collect_paragraphs_identifies_varied_structures() -> None:
     ]
     assert (table_entry["line_start"], table_entry["line_end"]) == (2, 4)
 
-    equation_entry = next(entry for entry in entries if entry["type"] == "equation")
+    equation_entry = by_type["equation"]
     assert equation_entry["lines"] == ["$$", "E = mc^2", "$$"]
     assert (equation_entry["line_start"], equation_entry["line_end"]) == (6, 8)
 
-    image_entry = next(entry for entry in entries if entry["type"] == "image_block")
+    image_entry = by_type["image_block"]
     assert image_entry["lines"] == [
         "![diagram](diagram.png)",
         "[diagram]: https://example.com/diagram.png",
     ]
     assert (image_entry["line_start"], image_entry["line_end"]) == (19, 20)
 
-    html_single_entry = next(entry for entry in entries if entry["type"] == "html_single")
+    html_single_entry = by_type["html_single"]
     assert html_single_entry["lines"] == ["<hr />"]
     assert (html_single_entry["line_start"], html_single_entry["line_end"]) == (24, 24)
 
-    equation_single_entry = next(entry for entry in entries if entry["type"] == "equation_single")
+    equation_single_entry = by_type["equation_single"]
     assert equation_single_entry["lines"] == ["$$x = y$$"]
     assert (equation_single_entry["line_start"], equation_single_entry["line_end"]) == (26, 26)
 
-    fence_entry = next(entry for entry in entries if entry["type"] == "code_fence")
+    fence_entry = by_type["code_fence"]
     assert fence_entry["lines"] == [
         "```python",
         "print('hi')",
@@ -97,7 +102,7 @@ def test_collect_paragraphs_identifies_varied_structures() -> None:
     ]
     assert (fence_entry["line_start"], fence_entry["line_end"]) == (14, 17)
 
-    html_entry = next(entry for entry in entries if entry["type"] == "html")
+    html_entry = by_type["html"]
     assert (html_entry["line_start"], html_entry["line_end"]) == (10, 12)
 
 
@@ -180,3 +185,16 @@ def test_format_newlines_is_idempotent_with_existing_spacing() -> None:
     once = tool.expand_single_newlines(text, "\n")
     twice = tool.expand_single_newlines(once, "\n")
     assert once == twice == "Alpha\n\nBeta"
+
+
+def test_plain_text_lines_match_structured_parse() -> None:
+    plain = "First line\r\n\r\n  Second line\r\nThird line"
+    paragraphs, metadata = collect_paragraphs_with_metadata(plain)
+    assert paragraphs == ["First line", "", "  Second line", "Third line"]
+    assert [entry["type"] for entry in metadata] == ["text", "blank", "text", "text"]
+    assert collect_paragraphs(plain) == paragraphs
+
+    # A fence opened after a carriage-return newline must still be recognised.
+    fenced = "Intro\r```\rcode\r```"
+    _, fenced_metadata = collect_paragraphs_with_metadata(fenced, newline="\r")
+    assert [entry["type"] for entry in fenced_metadata] == ["text", "code_fence"]
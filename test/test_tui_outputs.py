@@ -5,6 +5,13 @@ from pathlib import Path
 from md_tools.tui.app import PipelineStageModel, ToolManagerApp
 
 
+# Stage models are immutable, so every test can start from the same stages.
+_PIPELINE = (
+    PipelineStageModel("format-newlines", ()),
+    PipelineStageModel("combine", ()),
+)
+
+
 def _make_app(tmp_path: Path) -> tuple[ToolManagerApp, Path]:
     root = tmp_path / "workspace"
     root.mkdir()
@@ -12,10 +19,7 @@ def _make_app(tmp_path: Path) -> tuple[ToolManagerApp, Path]:
     input_path.write_text("hello world", encoding="utf-8")
     app = ToolManagerApp(root)
     app.set_selected_files([input_path])
-    app.pipeline = [
-        PipelineStageModel("format-newlines", []),
-        PipelineStageModel("combine", []),
-    ]
+    app.pipeline = list(_PIPELINE)
     app.ensure_output_defaults()
     return app, input_path
 
@@ -59,3 +63,51 @@ def test_stage_becomes_disabled_after_pipeline_extends(tmp_path: Path) -> None:
 
     app.add_stage("combine", [])
     assert 0 in app.output_disabled.get(input_path, set())
+
+
+
+def test_add_stage_before_defaults_creates_file_state(tmp_path: Path) -> None:
+    root = tmp_path / "workspace"
+    root.mkdir()
+    input_path = root / "note.md"
+    input_path.write_text("hello world", encoding="utf-8")
+    app = ToolManagerApp(root)
+    app.set_selected_files([input_path])
+    input_path = input_path.resolve()
+
+    app.add_stage("format-newlines", [])
+    # A file joining the selection after the defaults were generated has no state yet.
+    late_path = input_path.with_name("late.md")
+    app.selected_files.append(late_path)
+    app.add_stage("combine", [])
+
+    assert set(app.output_overrides[input_path]) == {0, 1}
+    assert app.output_disabled[input_path] == {0}
+    assert app.output_overrides[late_path][1].endswith("late_out_final.md")
+    assert app.output_disabled[late_path] == {0}
+
+
+def test_remove_middle_stage_shifts_manual_state(tmp_path: Path) -> None:
+    app, input_path = _make_app(tmp_path)
+    app.add_stage("combine", [])
+    app.update_output_override(input_path, 1, "custom.md")
+    app.update_output_disabled(input_path, 1, False)
+
+    app.remove_stage(0)
+
+    assert app.output_overrides[input_path][0] == "custom.md"
+    assert app.output_manual_overrides[input_path] == {0}
+    assert app.output_toggle_manual[input_path] == {0}
+    assert 0 not in app.output_disabled[input_path]
+    assert app.output_overrides[input_path][1].endswith("note_out_final.md")
+
+
+def test_remove_final_stage_promotes_previous_stage(tmp_path: Path) -> None:
+    app, input_path = _make_app(tmp_path)
+    assert 0 in app.output_disabled[input_path]
+
+    app.remove_stage(1)
+
+    assert list(app.output_overrides[input_path]) == [0]
+    assert app.output_overrides[input_path][0].endswith("note_out_final.md")
+    assert 0 not in app.output_disabled[input_path]